@@ -12,23 +12,31 @@ Command Structure:
 from __future__ import annotations
 
 import argparse
-import shutil
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from gvm.config import Config
-from gvm.modules import ModuleResult, ModuleStatus, get_module_class, list_modules
-from gvm.orchestrator import ModuleOrchestrator
-from gvm.utils.system import detect_debian_codename, is_port_listening, is_service_running
+# Config, modules and the orchestrator are imported inside the command
+# handlers that need them, so --help and argument errors stay fast
+if TYPE_CHECKING:
+    from gvm.config import Config
+    from gvm.modules import ModuleResult
 
 
+@functools.cache
 def check_curses_available() -> bool:
     """Check if curses is available and the terminal supports it.
 
+    The result is cached, since the terminal does not change during a run.
+
     Returns:
         True if curses is available and terminal supports it, False otherwise.
     """
+    # Without a terminal there is nothing to draw on; skip the curses import
+    if not sys.stdout.isatty():
+        return False
+
     try:
         import curses
     except ImportError:
@@ -42,63 +50,42 @@ def check_curses_available() -> bool:
         return False
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser with all subcommands.
+@functools.cache
+def _help_flag_parser() -> argparse.ArgumentParser:
+    """Return a parent parser holding the subcommand -h/--help flag.
 
-    Returns:
-        Configured ArgumentParser instance.
+    Built once and shared through ``parents=``, so subparsers reuse its
+    action objects instead of each constructing their own.
     """
-    parser = argparse.ArgumentParser(
-        prog="gvm",
-        description="GrapheneOS Debian VM Setup Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-
-    # Global flags
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_true",
-        help="Show detailed output",
-    )
-    parser.add_argument(
-        "--config",
-        type=Path,
-        metavar="PATH",
-        help="Use custom config file",
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Simulate without making changes",
-    )
-    parser.add_argument(
-        "-i",
-        "--interactive",
-        action="store_true",
-        help="Force interactive mode (default for setup)",
-    )
-    parser.add_argument(
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument(
         "-h",
         "--help",
         action="store_true",
-        help="Show this help message",
+        help="Show help for this command",
     )
-    parser.add_argument(
+    return parent
+
+
+@functools.cache
+def _common_flags_parser() -> argparse.ArgumentParser:
+    """Return a parent parser holding the -h/--help and -f/--force flags."""
+    parent = argparse.ArgumentParser(add_help=False, parents=[_help_flag_parser()])
+    parent.add_argument(
         "-f",
         "--force",
         action="store_true",
         help="Force re-run even if already installed",
     )
+    return parent
 
-    # Subparsers for commands
-    subparsers = parser.add_subparsers(dest="command", metavar="command")
 
-    # Setup command
+def _add_setup_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the setup subcommand."""
     setup_parser = subparsers.add_parser(
         "setup",
         help="Interactive setup with component selection (TUI)",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
     setup_parser.add_argument(
@@ -106,61 +93,34 @@ def create_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Non-interactive full setup",
     )
-    setup_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for setup command",
-    )
-    setup_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # APT command
-    apt_parser = subparsers.add_parser(
+
+def _add_apt_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the apt subcommand."""
+    subparsers.add_parser(
         "apt",
         help="Configure APT package manager",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
-    apt_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for apt command",
-    )
-    apt_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # SSH command
-    ssh_parser = subparsers.add_parser(
+
+def _add_ssh_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ssh subcommand."""
+    subparsers.add_parser(
         "ssh",
         help="Configure SSH server",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
-    ssh_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for ssh command",
-    )
-    ssh_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # Desktop command
+
+def _add_desktop_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the desktop subcommand."""
     desktop_parser = subparsers.add_parser(
         "desktop",
         help="Install desktop environment",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
     desktop_parser.add_argument(
@@ -169,61 +129,34 @@ def create_argument_parser() -> argparse.ArgumentParser:
         metavar="name|list",
         help="Desktop name to install or 'list' to show available",
     )
-    desktop_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for desktop command",
-    )
-    desktop_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # Shell command
-    shell_parser = subparsers.add_parser(
+
+def _add_shell_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the shell subcommand."""
+    subparsers.add_parser(
         "shell",
         help="Configure shell customizations",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
-    shell_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for shell command",
-    )
-    shell_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # GUI command
-    gui_parser = subparsers.add_parser(
+
+def _add_gui_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the gui subcommand."""
+    subparsers.add_parser(
         "gui",
         help="Install GUI helper scripts",
+        parents=[_common_flags_parser()],
         add_help=False,
     )
-    gui_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for gui command",
-    )
-    gui_parser.add_argument(
-        "-f",
-        "--force",
-        action="store_true",
-        help="Force re-run even if already installed",
-    )
 
-    # Start command
+
+def _add_start_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the start subcommand."""
     start_parser = subparsers.add_parser(
         "start",
         help="Launch desktop environment",
+        parents=[_help_flag_parser()],
         add_help=False,
     )
     start_parser.add_argument(
@@ -237,17 +170,14 @@ def create_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="List installed desktops",
     )
-    start_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for start command",
-    )
 
-    # GPU command
+
+def _add_gpu_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the gpu subcommand."""
     gpu_parser = subparsers.add_parser(
         "gpu",
         help="GPU status and diagnostics",
+        parents=[_help_flag_parser()],
         add_help=False,
     )
     gpu_parser.add_argument(
@@ -256,17 +186,14 @@ def create_argument_parser() -> argparse.ArgumentParser:
         choices=["status", "help"],
         help="GPU action: status or help",
     )
-    gpu_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for gpu command",
-    )
 
-    # Config command
+
+def _add_config_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the config subcommand."""
     config_parser = subparsers.add_parser(
         "config",
         help="Config management",
+        parents=[_help_flag_parser()],
         add_help=False,
     )
     config_parser.add_argument(
@@ -275,24 +202,23 @@ def create_argument_parser() -> argparse.ArgumentParser:
         choices=["init", "show"],
         help="Config action: init or show",
     )
-    config_parser.add_argument(
-        "-h",
-        "--help",
-        action="store_true",
-        help="Show help for config command",
-    )
 
-    # Info command
+
+def _add_info_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the info subcommand."""
     subparsers.add_parser(
         "info",
         help="Display system information",
         add_help=False,
     )
 
-    # Fix command
+
+def _add_fix_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the fix subcommand."""
     fix_parser = subparsers.add_parser(
         "fix",
         help="Run recovery commands",
+        parents=[_help_flag_parser()],
         add_help=False,
     )
     fix_parser.add_argument(
@@ -301,19 +227,127 @@ def create_argument_parser() -> argparse.ArgumentParser:
         metavar="target",
         help="Target to fix (apt, ssh, etc.)",
     )
-    fix_parser.add_argument(
+
+
+# Flags that request help, for the fast path in main()
+_HELP_FLAGS = ("-h", "--help")
+
+# Subcommand builders in the order they appear in help output
+_SUBPARSER_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "setup": _add_setup_parser,
+    "apt": _add_apt_parser,
+    "ssh": _add_ssh_parser,
+    "desktop": _add_desktop_parser,
+    "shell": _add_shell_parser,
+    "gui": _add_gui_parser,
+    "start": _add_start_parser,
+    "gpu": _add_gpu_parser,
+    "config": _add_config_parser,
+    "info": _add_info_parser,
+    "fix": _add_fix_parser,
+}
+
+# Known subcommand names, shared by argv sniffing and the help fast path
+_COMMANDS: frozenset[str] = frozenset(_SUBPARSER_BUILDERS)
+
+
+def _sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """Find the subcommand in argv without running the full parser.
+
+    Skips global flags (and the value of --config) and returns the first
+    positional token if it names a known command.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The subcommand name, or None if none was given or it is unknown.
+    """
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token == "--config":
+            skip_next = True
+            continue
+        if token.startswith("-"):
+            continue
+        return token if token in _COMMANDS else None
+    return None
+
+
+def create_argument_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+
+    Args:
+        command: Subcommand already known to be on the command line (see
+            _sniff_subcommand()). When given, only that subparser is built;
+            otherwise all subcommands are registered.
+
+    Returns:
+        Configured ArgumentParser instance.
+    """
+    parser = argparse.ArgumentParser(
+        prog="gvm",
+        description="GrapheneOS Debian VM Setup Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=False,
+    )
+
+    # Global flags
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show detailed output",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        metavar="PATH",
+        help="Use custom config file",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Simulate without making changes",
+    )
+    parser.add_argument(
+        "-i",
+        "--interactive",
+        action="store_true",
+        help="Force interactive mode (default for setup)",
+    )
+    parser.add_argument(
         "-h",
         "--help",
         action="store_true",
-        help="Show help for fix command",
+        help="Show this help message",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Force re-run even if already installed",
     )
 
+    # Subparsers for commands
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    if command in _COMMANDS:
+        # Only the selected command's arguments are needed to parse argv
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
     return parser
 
 
-def show_help() -> None:
-    """Display formatted help screen with command grouping and examples."""
-    help_text = """GrapheneOS Debian VM Setup Tool (gvm)
+# Top-level help screen. Help texts end with a blank line and are written
+# to stdout as-is.
+_HELP_MAIN = """GrapheneOS Debian VM Setup Tool (gvm)
 
 USAGE:
   gvm [command] [options]
@@ -353,18 +387,12 @@ EXAMPLES:
   gvm setup --all              # Non-interactive full setup
   gvm desktop plasma-mobile    # Install specific desktop
   gvm apt -v                   # Configure APT with verbose output
-"""
-    print(help_text)
 
+"""
 
-def show_command_help(command: str) -> None:
-    """Display help for a specific command.
-
-    Args:
-        command: The command to show help for.
-    """
-    help_texts = {
-        "setup": """gvm setup - Interactive Setup
+# Per-command help screens
+_HELP_TEXTS: dict[str, str] = {
+    "setup": """gvm setup - Interactive Setup
 
 USAGE:
   gvm setup [options]
@@ -375,8 +403,9 @@ OPTIONS:
 DESCRIPTION:
   Launches the interactive TUI for component selection and setup.
   Use --all to run all modules without interaction.
+
 """,
-        "apt": """gvm apt - Configure APT
+    "apt": """gvm apt - Configure APT
 
 USAGE:
   gvm apt [options]
@@ -384,16 +413,18 @@ USAGE:
 DESCRIPTION:
   Configures APT package manager with hardening settings, stabilizes
   Debian mirrors, cleans caches, repairs dpkg, and updates the system.
+
 """,
-        "ssh": """gvm ssh - Configure SSH
+    "ssh": """gvm ssh - Configure SSH
 
 USAGE:
   gvm ssh [options]
 
 DESCRIPTION:
   Configures SSH server with secure settings for remote access.
+
 """,
-        "desktop": """gvm desktop - Install Desktop Environment
+    "desktop": """gvm desktop - Install Desktop Environment
 
 USAGE:
   gvm desktop <name>
@@ -406,34 +437,39 @@ ARGUMENTS:
 DESCRIPTION:
   Installs and configures a desktop environment. Use 'list' to see
   available options.
+
 """,
-        "shell": """gvm shell - Configure Shell
+    "shell": """gvm shell - Configure Shell
 
 USAGE:
   gvm shell [options]
 
 DESCRIPTION:
   Applies shell customizations and configurations.
+
 """,
-        "gui": """gvm gui - Install GUI Helpers
+    "gui": """gvm gui - Install GUI Helpers
 
 USAGE:
   gvm gui [options]
 
 DESCRIPTION:
   Installs GUI helper scripts for easier desktop management.
+
 """,
-        "config": """gvm config - Configuration Management
+    "config": """gvm config - Configuration Management
 
 USAGE:
   gvm config init
   gvm config show
 
 ACTIONS:
-  init                  Create user config file at ~/.config/gvm/config.toml
+  init                  Create user config file at $XDG_CONFIG_HOME/gvm/config.toml
+                        (default ~/.config/gvm/config.toml)
   show                  Display effective (merged) configuration
+
 """,
-        "info": """gvm info - System Information
+    "info": """gvm info - System Information
 
 USAGE:
   gvm info
@@ -441,8 +477,9 @@ USAGE:
 DESCRIPTION:
   Displays system information including Debian version, installed
   modules, SSH status, and available desktops.
+
 """,
-        "fix": """gvm fix - Recovery Commands
+    "fix": """gvm fix - Recovery Commands
 
 USAGE:
   gvm fix <target>
@@ -453,8 +490,9 @@ TARGETS:
 
 DESCRIPTION:
   Runs recovery procedures for the specified target.
+
 """,
-        "start": """gvm start - Launch Desktop Environment
+    "start": """gvm start - Launch Desktop Environment
 
 USAGE:
   gvm start [desktop]
@@ -474,8 +512,9 @@ DESCRIPTION:
   - Last used desktop (if known)
   - Only installed desktop (if exactly one)
   - Shows list if multiple desktops installed
+
 """,
-        "gpu": """gvm gpu - GPU Status and Diagnostics
+    "gpu": """gvm gpu - GPU Status and Diagnostics
 
 USAGE:
   gvm gpu status
@@ -488,13 +527,43 @@ ACTIONS:
 DESCRIPTION:
   Provides GPU-related diagnostics and setup guidance for VirGL
   acceleration on GrapheneOS AVF VMs.
+
 """,
-    }
+}
 
-    if command in help_texts:
-        print(help_texts[command])
-    else:
-        show_help()
+
+def show_help() -> None:
+    """Display formatted help screen with command grouping and examples."""
+    sys.stdout.write(_HELP_MAIN)
+
+
+def show_command_help(command: str) -> None:
+    """Display help for a specific command.
+
+    Args:
+        command: The command to show help for.
+    """
+    sys.stdout.write(_HELP_TEXTS.get(command) or _HELP_MAIN)
+
+
+# Progress bar pieces, sliced per update instead of rebuilt
+_BAR_WIDTH = 30
+_BAR_FILLED = "=" * _BAR_WIDTH
+_BAR_EMPTY = " " * _BAR_WIDTH
+
+
+def _render_progress(percent: float, message: str) -> None:
+    """Redraw the single-line progress bar used by CLI commands.
+
+    Args:
+        percent: Progress from 0.0 to 1.0.
+        message: Status message shown after the bar.
+    """
+    filled = int(_BAR_WIDTH * percent)
+    bar = _BAR_FILLED[:filled] + ">" + _BAR_EMPTY[:max(_BAR_WIDTH - filled - 1, 0)]
+    print(f"\r[{bar}] {percent:.0%} {message}", end="", flush=True)
+    if percent >= 1.0:
+        print()  # Newline at completion
 
 
 def cmd_setup(args: argparse.Namespace, config: Config) -> int:
@@ -507,9 +576,8 @@ def cmd_setup(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("setup")
-        return 0
+    from gvm.modules import RecoveryAction, list_modules
+    from gvm.orchestrator import ModuleOrchestrator
 
     if args.all:
         # Non-interactive full setup - but prompt for desktop choice
@@ -580,20 +648,13 @@ def cmd_setup(args: argparse.Namespace, config: Config) -> int:
         def progress_callback(
             percent: float, message: str, operation: Optional[str]
         ) -> None:
-            bar_width = 30
-            filled = int(bar_width * percent)
-            bar = "=" * filled + ">" + " " * (bar_width - filled - 1)
-            print(f"\r[{bar}] {percent:.0%} {message}", end="", flush=True)
-            if percent >= 1.0:
-                print()  # Newline at completion
+            _render_progress(percent, message)
 
         def error_callback(module_name: str, result: ModuleResult) -> None:
             print(f"\nError in {module_name}: {result.message}")
             if result.recovery_command:
                 print(f"Recovery: {result.recovery_command}")
 
-        from gvm.modules import RecoveryAction
-
         results = orchestrator.execute(
             modules,
             progress_callback=progress_callback,
@@ -638,9 +699,13 @@ def cmd_module(args: argparse.Namespace, config: Config, module_name: str) -> in
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help(module_name)
-        return 0
+    from gvm.modules import (
+        ModuleStatus,
+        RecoveryAction,
+        get_module_class,
+        list_modules,
+    )
+    from gvm.orchestrator import ModuleOrchestrator
 
     # Validate module exists
     if get_module_class(module_name) is None:
@@ -662,14 +727,7 @@ def cmd_module(args: argparse.Namespace, config: Config, module_name: str) -> in
         if args.verbose and operation:
             print(f"  {operation}")
         else:
-            bar_width = 30
-            filled = int(bar_width * percent)
-            bar = "=" * filled + ">" + " " * (bar_width - filled - 1)
-            print(f"\r[{bar}] {percent:.0%} {message}", end="", flush=True)
-            if percent >= 1.0:
-                print()
-
-    from gvm.modules import RecoveryAction
+            _render_progress(percent, message)
 
     results = orchestrator.execute(
         [module_name],
@@ -705,10 +763,6 @@ def cmd_desktop(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("desktop")
-        return 0
-
     target = getattr(args, "desktop_target", None)
 
     if target is None or target == "list":
@@ -716,8 +770,13 @@ def cmd_desktop(args: argparse.Namespace, config: Config) -> int:
         desktops = config.discover_desktops()
 
         if not desktops:
+            from gvm.config import USER_CONFIG_DIR
+
             print("No desktop environments found.")
-            print("Desktop configurations should be in config/packages/ or ~/.config/gvm/packages/")
+            print(
+                "Desktop configurations should be in config/packages/ or "
+                f"{USER_CONFIG_DIR / 'packages'}/"
+            )
             return 0
 
         print("Available Desktop Environments:\n")
@@ -740,6 +799,8 @@ def cmd_desktop(args: argparse.Namespace, config: Config) -> int:
     desktops = config.discover_desktops()
 
     # Resolve desktop name with fuzzy matching
+    from gvm.modules import ModuleStatus, RecoveryAction, get_module_class
+    from gvm.orchestrator import ModuleOrchestrator
     from gvm.start import resolve_desktop_name
 
     resolved = resolve_desktop_name(config, target)
@@ -772,14 +833,7 @@ def cmd_desktop(args: argparse.Namespace, config: Config) -> int:
     def progress_callback(
         percent: float, message: str, operation: Optional[str]
     ) -> None:
-        bar_width = 30
-        filled = int(bar_width * percent)
-        bar = "=" * filled + ">" + " " * (bar_width - filled - 1)
-        print(f"\r[{bar}] {percent:.0%} {message}", end="", flush=True)
-        if percent >= 1.0:
-            print()
-
-    from gvm.modules import RecoveryAction
+        _render_progress(percent, message)
 
     results = orchestrator.execute(
         ["desktop"],
@@ -808,10 +862,6 @@ def cmd_config(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("config")
-        return 0
-
     action = getattr(args, "config_action", None)
 
     if action is None:
@@ -820,8 +870,9 @@ def cmd_config(args: argparse.Namespace, config: Config) -> int:
 
     if action == "init":
         # Create user config file
-        user_config_dir = Path.home() / ".config" / "gvm"
-        user_config_path = user_config_dir / "config.toml"
+        from gvm.config import REPO_CONFIG_PATH, USER_CONFIG_PATH
+
+        user_config_path = USER_CONFIG_PATH
 
         if user_config_path.exists():
             response = input(f"Config file already exists at {user_config_path}. Overwrite? [y/N] ")
@@ -829,14 +880,16 @@ def cmd_config(args: argparse.Namespace, config: Config) -> int:
                 print("Aborted.")
                 return 0
 
-        # Copy from default config (module is in src/gvm/)
-        default_config_path = Path(__file__).parent.parent.parent / "config" / "default.toml"
+        # Copy from default config
+        default_config_path = REPO_CONFIG_PATH
 
         if not default_config_path.exists():
             print(f"Error: Default config not found at {default_config_path}")
             return 1
 
-        user_config_dir.mkdir(parents=True, exist_ok=True)
+        import shutil
+
+        user_config_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(default_config_path, user_config_path)
         print(f"Created config file at {user_config_path}")
         return 0
@@ -870,6 +923,14 @@ def cmd_info(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
+    from gvm.modules import list_modules
+    from gvm.orchestrator import ModuleOrchestrator
+    from gvm.utils.system import (
+        detect_debian_codename,
+        is_port_listening,
+        is_service_running,
+    )
+
     print("GrapheneOS Debian VM System Information\n")
     print("=" * 45)
 
@@ -892,9 +953,18 @@ def cmd_info(args: argparse.Namespace, config: Config) -> int:
     orchestrator = ModuleOrchestrator(config)
     available_modules = list_modules()
 
+    # Load every module in one pass. An unknown or unimportable module stops
+    # that pass early; the loop below then loads the remaining modules one
+    # at a time and reports the failing one on its own line
+    try:
+        orchestrator.load_modules(available_modules)
+    except (ValueError, ImportError):
+        pass
+
     for module_name in available_modules:
         try:
-            orchestrator.load_modules([module_name])
+            if module_name not in orchestrator.modules:
+                orchestrator.load_modules([module_name])
             module = orchestrator.modules.get(module_name)
             if module:
                 is_installed, message = module.is_installed()
@@ -924,10 +994,6 @@ def cmd_fix(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("fix")
-        return 0
-
     target = getattr(args, "fix_target", None)
 
     if target is None:
@@ -936,6 +1002,8 @@ def cmd_fix(args: argparse.Namespace, config: Config) -> int:
 
     import subprocess
 
+    from gvm.utils.shell import apt_command
+
     # Default timeout for recovery commands (in seconds)
     CMD_TIMEOUT = 120
 
@@ -960,11 +1028,12 @@ def cmd_fix(args: argparse.Namespace, config: Config) -> int:
 
     if target == "apt":
         print("Running APT recovery...")
+        quiet = not args.verbose
         commands = [
-            (["sudo", "apt", "clean"], "Cleaning APT cache"),
+            (apt_command("apt-get", "clean", quiet=quiet), "Cleaning APT cache"),
             (["sudo", "dpkg", "--configure", "-a"], "Configuring dpkg"),
-            (["sudo", "apt", "-f", "install", "-y"], "Fixing broken dependencies"),
-            (["sudo", "apt", "update"], "Updating package index"),
+            (apt_command("apt-get", "-f", "install", "-y", quiet=quiet), "Fixing broken dependencies"),
+            (apt_command("apt-get", "update", quiet=quiet), "Updating package index"),
         ]
 
         for cmd, desc in commands:
@@ -1024,33 +1093,19 @@ def route_command(args: argparse.Namespace, config: Config) -> int:
         show_help()
         return 0
 
-    if command == "setup":
-        return cmd_setup(args, config)
-    elif command == "apt":
-        return cmd_module(args, config, "apt")
-    elif command == "ssh":
-        return cmd_module(args, config, "ssh")
-    elif command == "desktop":
-        return cmd_desktop(args, config)
-    elif command == "shell":
-        return cmd_module(args, config, "shell")
-    elif command == "gui":
-        return cmd_module(args, config, "gui")
-    elif command == "config":
-        return cmd_config(args, config)
-    elif command == "info":
-        return cmd_info(args, config)
-    elif command == "fix":
-        return cmd_fix(args, config)
-    elif command == "start":
-        return cmd_start(args, config)
-    elif command == "gpu":
-        return cmd_gpu(args, config)
-    else:
+    handler = _COMMAND_HANDLERS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         show_help()
         return 1
 
+    # Per-command -h/--help is answered here for every handler
+    if getattr(args, "help", False):
+        show_command_help(command)
+        return 0
+
+    return handler(args, config)
+
 
 def cmd_start(args: argparse.Namespace, config: Config) -> int:
     """Handle the start command.
@@ -1062,10 +1117,6 @@ def cmd_start(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("start")
-        return 0
-
     from gvm.start import cmd_start as start_impl
 
     return start_impl(
@@ -1086,10 +1137,6 @@ def cmd_gpu(args: argparse.Namespace, config: Config) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    if getattr(args, "help", False):
-        show_command_help("gpu")
-        return 0
-
     from gvm.gpu import cmd_gpu_help, cmd_gpu_status
 
     action = getattr(args, "gpu_action", None)
@@ -1106,13 +1153,39 @@ def cmd_gpu(args: argparse.Namespace, config: Config) -> int:
     return 0
 
 
+# Command name to handler, used by route_command()
+_COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace, Config], int]] = {
+    "setup": cmd_setup,
+    "apt": lambda args, config: cmd_module(args, config, "apt"),
+    "ssh": lambda args, config: cmd_module(args, config, "ssh"),
+    "desktop": cmd_desktop,
+    "shell": lambda args, config: cmd_module(args, config, "shell"),
+    "gui": lambda args, config: cmd_module(args, config, "gui"),
+    "config": cmd_config,
+    "info": cmd_info,
+    "fix": cmd_fix,
+    "start": cmd_start,
+    "gpu": cmd_gpu,
+}
+
+
 def main() -> int:
     """Main entry point for the CLI.
 
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    parser = create_argument_parser()
+    argv = sys.argv[1:]
+
+    # Plain help requests are answered without building a parser
+    if not argv or (len(argv) == 1 and argv[0] in (*_HELP_FLAGS, "help")):
+        show_help()
+        return 0
+    if len(argv) == 2 and argv[0] in _COMMANDS and argv[1] in _HELP_FLAGS:
+        show_command_help(argv[0])
+        return 0
+
+    parser = create_argument_parser(_sniff_subcommand(argv))
     args = parser.parse_args()
 
     # Handle top-level help
@@ -1120,10 +1193,12 @@ def main() -> int:
         show_help()
         return 0
 
+    from gvm.config import Config, ConfigError
+
     # Load configuration
     try:
         config = Config.load(cli_config_path=args.config)
-    except SystemExit as e:
+    except ConfigError as e:
         print(f"Error loading configuration: {e}")
         return 1
 
@@ -10,15 +10,75 @@ This module implements a layered configuration system with:
 
 from __future__ import annotations
 
-import copy
+import os
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 
-# Embedded defaults ensure zero-config operation
-EMBEDDED_DEFAULTS: dict = {
+# Fixed locations, resolved once per process. The repository root is three
+# levels up from this module (src/gvm/config.py). The config file paths are
+# public so that 'gvm config init' can copy one onto the other.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+REPO_CONFIG_PATH = _REPO_ROOT / "config" / "default.toml"
+_REPO_PACKAGES = _REPO_ROOT / "config" / "packages"
+
+# Per-user gvm directory ($XDG_CONFIG_HOME/gvm, default ~/.config/gvm).
+# Every user file gvm reads or writes, config and saved state alike, lives
+# here, so other modules build their paths from this constant.
+USER_CONFIG_DIR = (
+    Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "gvm"
+)
+USER_CONFIG_PATH = USER_CONFIG_DIR / "config.toml"
+_USER_PACKAGES = USER_CONFIG_DIR / "packages"
+
+# Desktop directories with at least this many TOML files are read in a
+# thread pool; smaller ones are not worth the pool start-up cost
+_PARALLEL_SCAN_THRESHOLD = 4
+_MAX_SCAN_WORKERS = 8
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of a nested dict/list structure.
+
+    Dicts become MappingProxyType views and lists become tuples, so shared
+    defaults cannot be modified by accident.
+
+    Args:
+        value: Value to freeze.
+
+    Returns:
+        Frozen equivalent of the value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable copy of a structure frozen by _freeze().
+
+    Args:
+        value: Value to thaw.
+
+    Returns:
+        Equivalent value using plain dicts and lists.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Embedded defaults ensure zero-config operation. Frozen, so they can be
+# shared between loads without copying.
+EMBEDDED_DEFAULTS: Mapping[str, Any] = _freeze({
     "meta": {
         "tool_version": "1.0.0",
         "default_distro": "debian-trixie",
@@ -36,7 +96,10 @@ EMBEDDED_DEFAULTS: dict = {
         "retries": 10,
         "http_timeout": 60,
         "https_timeout": 60,
-        "pipeline_depth": 0,
+        "prefetch": False,
+        "refresh_interval": 86400,
+        "update_max_age": 900,
+        "install_recommends": False,
         "mirrors": [
             "https://deb.debian.org/debian",
             "https://security.debian.org/debian-security",
@@ -60,12 +123,48 @@ EMBEDDED_DEFAULTS: dict = {
         "show_ssh_note": True,
         "ssh_note": "Note: GrapheneOS Terminal Port Control will NOT expose port 22.",
     },
-}
+})
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration or desktop TOML file cannot be loaded."""
+
+
+# Parsed TOML files keyed by (resolved path, mtime_ns, size), so repeated
+# Config.load() and discover_desktops() calls skip the read and parse.
+# Entries are frozen so a caller can never change what later loads see
+_TOML_CACHE: dict[tuple[str, int, int], Mapping[str, Any]] = {}
+
+# Whether each file is a loadable desktop, keyed like _TOML_CACHE. Only the
+# verdict is kept: every load builds its own DesktopConfig from the cached
+# TOML data, so no two Config instances share one
+_DESKTOP_FILE_INDEX: dict[tuple[str, int, int], bool] = {}
+
+
+def _file_identity(path: Path) -> Optional[tuple[str, int, int]]:
+    """Return a cache key identifying the current contents of a file.
+
+    Args:
+        path: File to identify.
+
+    Returns:
+        Tuple of (resolved path, st_mtime_ns, st_size), or None if the
+        file doesn't exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
 def _load_toml(path: Path) -> dict:
     """Load a TOML file and return its contents as a dictionary.
 
+    Parsed results are cached per file identity (path, modification time
+    and size), so an unchanged file is only read and parsed once per
+    process. Each call returns a fresh mutable copy of the cached data.
+
     Args:
         path: Path to the TOML file.
 
@@ -73,16 +172,24 @@ def _load_toml(path: Path) -> dict:
         Dictionary with TOML contents, or empty dict if file doesn't exist.
 
     Raises:
-        SystemExit: If TOML parsing fails with a clear error message.
+        ConfigError: If TOML parsing fails with a clear error message.
     """
-    if not path.exists():
+    key = _file_identity(path)
+    if key is None:
         return {}
 
+    cached = _TOML_CACHE.get(key)
+    if cached is not None:
+        return _thaw(cached)
+
     try:
         with open(path, "rb") as f:
-            return tomllib.load(f)
+            data = tomllib.load(f)
     except tomllib.TOMLDecodeError as e:
-        raise SystemExit(f"Error parsing TOML file '{path}': {e}") from e
+        raise ConfigError(f"Error parsing TOML file '{path}': {e}") from e
+
+    _TOML_CACHE[key] = _freeze(data)
+    return data
 
 
 def _merge_configs(base: dict, override: dict) -> dict:
@@ -99,13 +206,8 @@ def _merge_configs(base: dict, override: dict) -> dict:
     Returns:
         New dictionary with merged configuration.
     """
-    result = base.copy()
-
-    for key, value in override.items():
-        # Replace value entirely (no recursive merging)
-        result[key] = value
-
-    return result
+    # Dict union replaces values entirely (no recursive merging)
+    return base | override
 
 
 @dataclass
@@ -146,6 +248,13 @@ class DesktopConfig:
     conflicts_with: list[str] = field(default_factory=list)
     conflict_packages: list[str] = field(default_factory=list)
 
+    # Combined package list, built once from the lists above
+    _all_packages: list[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the combined package list."""
+        self.invalidate()
+
     @classmethod
     def from_toml(cls, toml_path: Path) -> DesktopConfig:
         """Load a DesktopConfig from a TOML file.
@@ -157,12 +266,26 @@ class DesktopConfig:
             DesktopConfig instance populated from TOML data.
 
         Raises:
-            SystemExit: If required fields are missing or TOML parsing fails.
+            ConfigError: If required fields are missing or TOML parsing fails.
         """
-        data = _load_toml(toml_path)
+        return cls.from_data(_load_toml(toml_path), toml_path)
+
+    @classmethod
+    def from_data(cls, data: dict, toml_path: Path) -> DesktopConfig:
+        """Create a DesktopConfig from already parsed TOML data.
+
+        Args:
+            data: Parsed contents of a desktop TOML file.
+            toml_path: Path the data was loaded from, used in error messages.
+
+        Returns:
+            DesktopConfig instance populated from TOML data.
 
+        Raises:
+            ConfigError: If the data is empty or required fields are missing.
+        """
         if not data:
-            raise SystemExit(f"Failed to load desktop config from '{toml_path}'")
+            raise ConfigError(f"Failed to load desktop config from '{toml_path}'")
 
         meta = data.get("meta", {})
         packages = data.get("packages", {})
@@ -173,7 +296,7 @@ class DesktopConfig:
 
         name = meta.get("name")
         if not name:
-            raise SystemExit(f"Desktop config '{toml_path}' missing required 'meta.name'")
+            raise ConfigError(f"Desktop config '{toml_path}' missing required 'meta.name'")
 
         # Display name defaults to name if not provided
         display_name = meta.get("display_name", name)
@@ -199,18 +322,64 @@ class DesktopConfig:
     def get_all_packages(self) -> list[str]:
         """Return combined list of all packages.
 
+        The combined list is built once; each call returns a copy of it,
+        so callers may modify the result. Call invalidate() after changing
+        a package list.
+
         Returns:
             List containing core, optional, wayland_helpers, and user packages.
         """
-        return (
-            self.packages_core
-            + self.packages_optional
-            + self.packages_wayland_helpers
-            + self.packages_user
-        )
+        return list(self._all_packages)
 
+    def invalidate(self) -> None:
+        """Rebuild the combined package list after a package list changed."""
+        self._all_packages = [
+            *self.packages_core,
+            *self.packages_optional,
+            *self.packages_wayland_helpers,
+            *self.packages_user,
+        ]
 
-@dataclass
+
+def _load_desktop_file(toml_file: Path) -> Optional[DesktopConfig]:
+    """Load a desktop TOML file, skipping anything that is not a desktop.
+
+    Whether the file is a desktop is indexed by file identity (path,
+    modification time and size), so later scans skip non-desktop and
+    broken files without looking at their contents again. Desktop files
+    get a new DesktopConfig on every call.
+
+    Args:
+        toml_file: Path to the TOML file.
+
+    Returns:
+        DesktopConfig instance, or None if the file is missing, fails to
+        parse, or is not of type "desktop".
+    """
+    key = _file_identity(toml_file)
+    if key is None:
+        return None
+
+    if _DESKTOP_FILE_INDEX.get(key) is False:
+        return None
+
+    desktop_config: Optional[DesktopConfig] = None
+    try:
+        data = _load_toml(toml_file)
+
+        # Only process desktop type configs
+        if data.get("meta", {}).get("type") == "desktop":
+            desktop_config = DesktopConfig.from_data(data, toml_file)
+
+    except ConfigError:
+        # Skip files that fail to parse
+        pass
+
+    _DESKTOP_FILE_INDEX[key] = desktop_config is not None
+    return desktop_config
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration container for GVM tool.
 
@@ -223,6 +392,10 @@ class Config:
         features: Feature flags (install_desktop, install_shell_mods, etc.).
         banner: Banner display settings (title, ssh_note, etc.).
         selected_desktop: Runtime-set desktop name for installation.
+
+    Frequently used settings (vm_user, ssh_forward_port, apt_retries, ...)
+    are read out of their sections once at construction and stored as
+    plain slotted attributes.
     """
 
     meta: dict = field(default_factory=dict)
@@ -241,10 +414,63 @@ class Config:
         default=None, repr=False, compare=False
     )
 
+    # Desktops loaded one at a time by get_desktop() (not serialized)
+    _desktop_lookup: dict[str, "DesktopConfig"] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # Runtime selections made by the TUI (not serialized)
+    _selected_desktops: Optional[list[str]] = field(
+        default=None, repr=False, compare=False
+    )
+    _user_settings: dict = field(default_factory=dict, repr=False, compare=False)
+
+    # Settings derived from the sections above in __post_init__
+    vm_user: str = field(init=False, repr=False, compare=False)
+    host_name: str = field(init=False, repr=False, compare=False)
+    ssh_forward_port: int = field(init=False, repr=False, compare=False)
+    ssh_internal_port: int = field(init=False, repr=False, compare=False)
+    apt_retries: int = field(init=False, repr=False, compare=False)
+    apt_http_timeout: int = field(init=False, repr=False, compare=False)
+    apt_https_timeout: int = field(init=False, repr=False, compare=False)
+    apt_pipeline_depth: Optional[int] = field(init=False, repr=False, compare=False)
+    apt_prefetch: bool = field(init=False, repr=False, compare=False)
+    apt_install_recommends: bool = field(init=False, repr=False, compare=False)
+    apt_refresh_interval: int = field(init=False, repr=False, compare=False)
+    apt_update_max_age: int = field(init=False, repr=False, compare=False)
+    apt_mirrors: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    apt_base_packages: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    install_desktop: bool = field(init=False, repr=False, compare=False)
+    install_shell_mods: bool = field(init=False, repr=False, compare=False)
+    show_banner: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Read commonly used settings out of their sections once."""
+        self.vm_user = self.environment.get("vm_user", "droid")
+        self.host_name = self.environment.get("host_name", "GrapheneOS Terminal")
+        self.ssh_forward_port = self.ports.get("ssh_forward", 2222)
+        self.ssh_internal_port = self.ports.get("ssh_internal", 22)
+        self.apt_retries = self.apt.get("retries", 10)
+        self.apt_http_timeout = self.apt.get("http_timeout", 60)
+        self.apt_https_timeout = self.apt.get("https_timeout", 60)
+        self.apt_pipeline_depth = self.apt.get("pipeline_depth")
+        self.apt_prefetch = self.apt.get("prefetch", False)
+        self.apt_install_recommends = self.apt.get("install_recommends", False)
+        self.apt_refresh_interval = self.apt.get("refresh_interval", 86400)
+        self.apt_update_max_age = self.apt.get("update_max_age", 900)
+        self.apt_mirrors = tuple(self.apt.get("mirrors", ()))
+        self.apt_base_packages = tuple(self.apt.get("base_packages", ()))
+        self.install_desktop = self.features.get("install_desktop", True)
+        self.install_shell_mods = self.features.get("install_shell_mods", True)
+        self.show_banner = self.features.get("show_banner", True)
+
     @classmethod
     def from_dict(cls, data: dict) -> Config:
         """Create a Config instance from a dictionary.
 
+        Sections taken from the frozen embedded defaults are copied out into
+        plain dicts and lists.
+
         Args:
             data: Dictionary containing configuration data.
 
@@ -252,13 +478,13 @@ class Config:
             Config instance with validated fields.
         """
         return cls(
-            meta=data.get("meta", {}),
-            environment=data.get("environment", {}),
-            ports=data.get("ports", {}),
-            apt=data.get("apt", {}),
-            ssh=data.get("ssh", {}),
-            features=data.get("features", {}),
-            banner=data.get("banner", {}),
+            meta=_thaw(data.get("meta", {})),
+            environment=_thaw(data.get("environment", {})),
+            ports=_thaw(data.get("ports", {})),
+            apt=_thaw(data.get("apt", {})),
+            ssh=_thaw(data.get("ssh", {})),
+            features=_thaw(data.get("features", {})),
+            banner=_thaw(data.get("banner", {})),
         )
 
     @classmethod
@@ -272,7 +498,7 @@ class Config:
         Priority order (later overrides earlier):
         1. Embedded defaults (EMBEDDED_DEFAULTS)
         2. Repository config (config/default.toml)
-        3. XDG user config (~/.config/gvm/config.toml)
+        3. XDG user config ($XDG_CONFIG_HOME/gvm/config.toml, default ~/.config)
         4. CLI-specified config file (if provided)
         5. CLI flag overrides (if provided)
 
@@ -282,30 +508,32 @@ class Config:
 
         Returns:
             Config instance with merged configuration from all sources.
+
+        Raises:
+            ConfigError: If a config file exists but cannot be parsed.
         """
-        # Start with deep copy of embedded defaults to prevent shared references
-        config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
-
-        # Repository config path (relative to this module in src/gvm/)
-        repo_config_path = Path(__file__).parent.parent.parent / "config" / "default.toml"
-        if repo_config_path.exists():
-            repo_config = _load_toml(repo_config_path)
-            config_data = _merge_configs(config_data, repo_config)
-
-        # XDG user config
-        user_config_path = Path.home() / ".config" / "gvm" / "config.toml"
-        if user_config_path.exists():
-            user_config = _load_toml(user_config_path)
-            config_data = _merge_configs(config_data, user_config)
-
-        # CLI-specified config file
-        if cli_config_path and cli_config_path.exists():
-            cli_config = _load_toml(cli_config_path)
-            config_data = _merge_configs(config_data, cli_config)
+        # Config files that exist, in priority order: repository config,
+        # XDG user config, then the CLI-specified config file
+        config_paths = [
+            path
+            for path in (REPO_CONFIG_PATH, USER_CONFIG_PATH, cli_config_path)
+            if path and path.exists()
+        ]
+
+        # Zero-config fast path: nothing to merge over the embedded defaults
+        if not config_paths and not cli_overrides:
+            return cls.from_dict(EMBEDDED_DEFAULTS)
+
+        # Merging replaces whole sections and never mutates them in place,
+        # so a shallow copy of the embedded defaults is enough
+        config_data = EMBEDDED_DEFAULTS.copy()
+
+        for path in config_paths:
+            config_data |= _load_toml(path)
 
         # CLI flag overrides (highest priority)
         if cli_overrides:
-            config_data = _merge_configs(config_data, cli_overrides)
+            config_data |= cli_overrides
 
         return cls.from_dict(config_data)
 
@@ -330,18 +558,45 @@ class Config:
         desktops: dict[str, DesktopConfig] = {}
 
         # Scan repository packages directory
-        repo_packages_dir = Path(__file__).parent.parent.parent / "config" / "packages"
-        desktops = self._scan_desktop_directory(repo_packages_dir, desktops)
+        desktops = self._scan_desktop_directory(_REPO_PACKAGES, desktops)
 
         # Scan user packages directory (can override repository configs)
-        user_packages_dir = Path.home() / ".config" / "gvm" / "packages"
-        desktops = self._scan_desktop_directory(user_packages_dir, desktops)
+        desktops = self._scan_desktop_directory(_USER_PACKAGES, desktops)
 
         # Cache the result
         self._desktop_cache = desktops
 
         return desktops
 
+    def get_desktop(self, name: str) -> Optional[DesktopConfig]:
+        """Look up a single desktop without scanning every desktop file.
+
+        Tries ``<name>.toml`` in the user packages directory, then in the
+        repository packages directory, and parses only that file. Falls back
+        to discover_desktops() when no file is named after the desktop.
+
+        Args:
+            name: Canonical desktop name (e.g., 'plasma-mobile').
+
+        Returns:
+            DesktopConfig for the desktop, or None if it does not exist.
+        """
+        if self._desktop_cache is not None:
+            return self._desktop_cache.get(name)
+
+        if name in self._desktop_lookup:
+            return self._desktop_lookup[name]
+
+        # Only plain names can map onto a file in the packages directories
+        if name and "/" not in name:
+            for directory in (_USER_PACKAGES, _REPO_PACKAGES):
+                desktop = _load_desktop_file(directory / f"{name}.toml")
+                if desktop is not None and desktop.name == name:
+                    self._desktop_lookup[name] = desktop
+                    return desktop
+
+        return self.discover_desktops().get(name)
+
     def _scan_desktop_directory(
         self, directory: Path, desktops: dict[str, DesktopConfig]
     ) -> dict[str, DesktopConfig]:
@@ -354,74 +609,29 @@ class Config:
         Returns:
             Updated desktops dictionary.
         """
-        if not directory.exists():
+        try:
+            with os.scandir(directory) as entries:
+                toml_files = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".toml")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError):
             return desktops
 
-        for toml_file in directory.glob("*.toml"):
-            try:
-                data = _load_toml(toml_file)
-                meta = data.get("meta", {})
-
-                # Only process desktop type configs
-                if meta.get("type") != "desktop":
-                    continue
-
-                desktop_config = DesktopConfig.from_toml(toml_file)
+        # Overlap file reads on larger directories; map() keeps results in
+        # file order so later files still override earlier ones
+        if len(toml_files) >= _PARALLEL_SCAN_THRESHOLD:
+            workers = min(_MAX_SCAN_WORKERS, len(toml_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_desktop_file, toml_files))
+        else:
+            results = [_load_desktop_file(toml_file) for toml_file in toml_files]
+
+        for desktop_config in results:
+            if desktop_config is not None:
                 desktops[desktop_config.name] = desktop_config
 
-            except SystemExit:
-                # Skip files that fail to parse
-                continue
-
         return desktops
-
-    # Convenience property accessors for common settings
-    @property
-    def vm_user(self) -> str:
-        """Get the VM user name."""
-        return self.environment.get("vm_user", "droid")
-
-    @property
-    def host_name(self) -> str:
-        """Get the host name."""
-        return self.environment.get("host_name", "GrapheneOS Terminal")
-
-    @property
-    def ssh_forward_port(self) -> int:
-        """Get the SSH forward port."""
-        return self.ports.get("ssh_forward", 2222)
-
-    @property
-    def ssh_internal_port(self) -> int:
-        """Get the SSH internal port."""
-        return self.ports.get("ssh_internal", 22)
-
-    @property
-    def apt_retries(self) -> int:
-        """Get APT retry count."""
-        return self.apt.get("retries", 10)
-
-    @property
-    def apt_http_timeout(self) -> int:
-        """Get APT HTTP timeout."""
-        return self.apt.get("http_timeout", 60)
-
-    @property
-    def apt_https_timeout(self) -> int:
-        """Get APT HTTPS timeout."""
-        return self.apt.get("https_timeout", 60)
-
-    @property
-    def install_desktop(self) -> bool:
-        """Check if desktop installation is enabled."""
-        return self.features.get("install_desktop", True)
-
-    @property
-    def install_shell_mods(self) -> bool:
-        """Check if shell modifications are enabled."""
-        return self.features.get("install_shell_mods", True)
-
-    @property
-    def show_banner(self) -> bool:
-        """Check if banner should be shown."""
-        return self.features.get("show_banner", True)
@@ -8,17 +8,87 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
+import time
 from pathlib import Path
+from typing import Optional
 
+# Wayland socket of the current user; the uid cannot change during a run
+_WAYLAND_SOCKET = Path(f"/run/user/{os.getuid()}/wayland-0")
 
-def check_virgl_status() -> tuple[bool, str]:
+# DRM devices as seen by the kernel
+_SYSFS_DRM = Path("/sys/class/drm")
+
+# Seconds a check_virgl_status() result stays valid
+_VIRGL_STATUS_TTL = 5.0
+
+# (monotonic timestamp, result) of the last VirGL probe
+_virgl_status_cache: Optional[tuple[float, tuple[bool, str]]] = None
+
+# VirGL setup instructions shown by 'gvm gpu help'
+_VIRGL_HELP = """
+GPU Acceleration Setup (VirGL)
+
+VirGL must be enabled BEFORE starting the VM. This cannot be
+done from inside the VM due to AVF security isolation.
+
+To enable VirGL GPU acceleration:
+
+  1. Close the Terminal app completely (swipe away from recents)
+  2. Open the Files app on your Android device
+  3. Navigate to: Internal Storage > linux
+     (create the 'linux' folder if it doesn't exist)
+  4. Create an empty file named: virglrenderer
+     (the content doesn't matter, just the filename)
+  5. Reopen the Terminal app - you should see a toast
+     message saying "VirGL enabled"
+
+Note: VirGL provides OpenGL acceleration via ANGLE. Some
+applications requiring newer OpenGL versions may not work
+until full GPU virtualization is available (Pixel 10+).
+
+To verify VirGL is working:
+  - Run: gvm gpu status
+  - Run: glxinfo -B | grep -i renderer
+
+"""
+
+
+def check_virgl_status(force: bool = False) -> tuple[bool, str]:
     """Check if VirGL appears to be active.
 
+    The result is reused for a few seconds, so repeated checks within one
+    run do not spawn glxinfo again.
+
+    Args:
+        force: If True, ignore any cached result and probe again.
+
     Returns:
         Tuple of (is_active, message) with status details.
         is_active is computed from GPU-specific signals only (DRI devices
         and VirGL/Zink renderer detection), not from Wayland status.
     """
+    global _virgl_status_cache
+
+    now = time.monotonic()
+    if (
+        not force
+        and _virgl_status_cache is not None
+        and now - _virgl_status_cache[0] < _VIRGL_STATUS_TTL
+    ):
+        return _virgl_status_cache[1]
+
+    status = _probe_virgl_status()
+    _virgl_status_cache = (now, status)
+    return status
+
+
+def _probe_virgl_status() -> tuple[bool, str]:
+    """Probe DRI devices, the GL renderer and the Wayland socket.
+
+    Returns:
+        Tuple of (is_active, message), as returned by check_virgl_status().
+    """
     indicators = []
     gpu_signals = []  # Track GPU-specific positive signals
     software_rendering = False  # Track if software rendering is detected
@@ -31,33 +101,42 @@ def check_virgl_status() -> tuple[bool, str]:
     else:
         indicators.append("✗ No DRI devices found")
 
-    # Check glxinfo if available
-    try:
-        result = subprocess.run(
-            ["glxinfo", "-B"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            check=False,
-        )
-        if result.returncode == 0:
-            output = result.stdout.lower()
-            if "virgl" in output or "zink" in output:
-                indicators.append("✓ VirGL/Zink renderer detected")
-                gpu_signals.append(True)
+    # Identify the renderer from sysfs first; glxinfo spawns a process and
+    # initializes Mesa, so it is only run when sysfs is inconclusive
+    renderer = _detect_renderer_via_sysfs()
+    if renderer is True:
+        indicators.append("✓ VirGL render node detected (virtio_gpu)")
+        gpu_signals.append(True)
+    elif renderer is False:
+        indicators.append("✗ No GPU render node (software rendering)")
+        software_rendering = True
+    else:
+        # Check glxinfo if available
+        try:
+            result = subprocess.run(
+                ["glxinfo", "-B"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=False,
+            )
+            if result.returncode == 0:
+                output = result.stdout.lower()
+                if "virgl" in output or "zink" in output:
+                    indicators.append("✓ VirGL/Zink renderer detected")
+                    gpu_signals.append(True)
+                else:
+                    indicators.append("✗ Software rendering detected")
+                    software_rendering = True
             else:
-                indicators.append("✗ Software rendering detected")
-                software_rendering = True
-        else:
-            indicators.append("⚠ glxinfo failed to run")
-    except FileNotFoundError:
-        indicators.append("⚠ glxinfo not installed (run: sudo apt install mesa-utils)")
-    except subprocess.TimeoutExpired:
-        indicators.append("⚠ glxinfo timed out")
+                indicators.append("⚠ glxinfo failed to run")
+        except FileNotFoundError:
+            indicators.append("⚠ glxinfo not installed (run: sudo apt install mesa-utils)")
+        except subprocess.TimeoutExpired:
+            indicators.append("⚠ glxinfo timed out")
 
     # Check Wayland display (informational only, not used for is_active)
-    wayland_display = Path(f"/run/user/{os.getuid()}/wayland-0")
-    if wayland_display.exists():
+    if _WAYLAND_SOCKET.exists():
         indicators.append("✓ Wayland display active")
     else:
         indicators.append("✗ Wayland display not active")
@@ -69,34 +148,35 @@ def check_virgl_status() -> tuple[bool, str]:
     return is_active, message
 
 
-def show_virgl_help() -> None:
-    """Display VirGL setup instructions."""
-    help_text = """
-GPU Acceleration Setup (VirGL)
+def _detect_renderer_via_sysfs() -> Optional[bool]:
+    """Check the kernel driver behind the DRM render nodes.
 
-VirGL must be enabled BEFORE starting the VM. This cannot be
-done from inside the VM due to AVF security isolation.
+    VirGL is exposed to the guest through the virtio_gpu driver, whose
+    render node shows up under /sys/class/drm.
 
-To enable VirGL GPU acceleration:
+    Returns:
+        True if a render node is driven by virtio_gpu, False if there are
+        no render nodes at all, or None if the answer is unclear (another
+        driver, or sysfs is unreadable).
+    """
+    render_nodes = list(_SYSFS_DRM.glob("renderD*"))
+    if not render_nodes:
+        return False if _SYSFS_DRM.exists() else None
 
-  1. Close the Terminal app completely (swipe away from recents)
-  2. Open the Files app on your Android device
-  3. Navigate to: Internal Storage > linux
-     (create the 'linux' folder if it doesn't exist)
-  4. Create an empty file named: virglrenderer
-     (the content doesn't matter, just the filename)
-  5. Reopen the Terminal app - you should see a toast
-     message saying "VirGL enabled"
+    for node in render_nodes:
+        try:
+            uevent = (node / "device" / "uevent").read_text()
+        except OSError:
+            continue
+        if "DRIVER=virtio_gpu" in uevent.splitlines():
+            return True
 
-Note: VirGL provides OpenGL acceleration via ANGLE. Some
-applications requiring newer OpenGL versions may not work
-until full GPU virtualization is available (Pixel 10+).
+    return None
 
-To verify VirGL is working:
-  - Run: gvm gpu status
-  - Run: glxinfo -B | grep -i renderer
-"""
-    print(help_text)
+
+def show_virgl_help() -> None:
+    """Display VirGL setup instructions."""
+    sys.stdout.write(_VIRGL_HELP)
 
 
 def cmd_gpu_status(verbose: bool = False) -> int:
@@ -7,6 +7,7 @@ be retrieved by name using get_module_class().
 
 Public API:
     AVAILABLE_MODULES: Dict mapping normalized module names to module classes
+    AVAILABLE_MODULE_NAMES: Frozen set of normalized module names
     get_module_class(name): Retrieve a module class by name
     list_modules(): Get a list of all available module names
 
@@ -16,9 +17,9 @@ Re-exported from base:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from gvm.modules.apt import APTModule
 from gvm.modules.base import (
     Dependency,
     Module,
@@ -26,27 +27,48 @@ from gvm.modules.base import (
     ModuleStatus,
     RecoveryAction,
 )
-from gvm.modules.desktop import DesktopModule
-from gvm.modules.gui import GUIModule
-from gvm.modules.shell import ShellModule
-from gvm.modules.ssh import SSHModule
-from gvm.modules.user import UserModule
 
 if TYPE_CHECKING:
     from typing import Optional
 
-# Registry of available modules, mapping normalized names to module classes.
-AVAILABLE_MODULES: dict[str, type[Module]] = {
-    "apt": APTModule,
-    "user": UserModule,
-    "desktop": DesktopModule,
-    "ssh": SSHModule,
-    "shell": ShellModule,
-    "gui": GUIModule,
+    from gvm.modules.apt import APTModule  # noqa: F401
+    from gvm.modules.desktop import DesktopModule  # noqa: F401
+    from gvm.modules.gui import GUIModule  # noqa: F401
+    from gvm.modules.shell import ShellModule  # noqa: F401
+    from gvm.modules.ssh import SSHModule  # noqa: F401
+    from gvm.modules.user import UserModule  # noqa: F401
+
+# Module classes keyed by the name they are registered under, as
+# "package.module:ClassName" references. Implementations are only imported
+# when first looked up, so commands that never run a module (--help,
+# status, list) do not pay for importing all of them.
+_RAW_MODULES: dict[str, str] = {
+    "apt": "gvm.modules.apt:APTModule",
+    "user": "gvm.modules.user:UserModule",
+    "desktop": "gvm.modules.desktop:DesktopModule",
+    "ssh": "gvm.modules.ssh:SSHModule",
+    "shell": "gvm.modules.shell:ShellModule",
+    "gui": "gvm.modules.gui:GUIModule",
 }
 
+# Registry references keyed by normalized name. Keys are normalized once
+# here so lookups with already-clean names skip normalization entirely.
+_MODULE_PATHS: dict[str, str] = {
+    name.lower().strip(): path for name, path in _RAW_MODULES.items()
+}
+
+# Normalized module names, for O(1) validation without importing anything.
+AVAILABLE_MODULE_NAMES: frozenset[str] = frozenset(_MODULE_PATHS)
+
+# Sorted module names, computed once since the registry never changes.
+_SORTED_MODULE_NAMES: tuple[str, ...] = tuple(sorted(_MODULE_PATHS))
+
+# Module classes resolved so far, filled in by _load_module_class()
+_loaded_modules: dict[str, type[Module]] = {}
+
 __all__ = [
     "AVAILABLE_MODULES",
+    "AVAILABLE_MODULE_NAMES",
     "Dependency",
     "Module",
     "ModuleResult",
@@ -58,11 +80,44 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Build AVAILABLE_MODULES on first access.
+
+    Accessing the full registry imports every module implementation, so it
+    is only materialized for callers that ask for it.
+    """
+    if name == "AVAILABLE_MODULES":
+        # Registry of available modules, mapping normalized names to classes
+        registry = {key: _load_module_class(key) for key in _MODULE_PATHS}
+        globals()["AVAILABLE_MODULES"] = registry
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_module_class(key: str) -> type[Module]:
+    """Import and cache the module class registered under a normalized name.
+
+    Args:
+        key: Normalized module name present in _MODULE_PATHS.
+
+    Returns:
+        The module class.
+    """
+    module_class = _loaded_modules.get(key)
+    if module_class is None:
+        module_path, class_name = _MODULE_PATHS[key].split(":")
+        module_class = getattr(importlib.import_module(module_path), class_name)
+        _loaded_modules[key] = module_class
+    return module_class
+
+
 def normalize_module_name(name: str) -> str:
     """Normalize a module name for consistent lookup.
 
     Converts the name to lowercase and strips whitespace to ensure
-    consistent matching regardless of how the name is provided.
+    consistent matching regardless of how the name is provided. Names that
+    are already registered are returned as-is without allocating new
+    strings.
 
     Args:
         name: The module name to normalize
@@ -70,13 +125,16 @@ def normalize_module_name(name: str) -> str:
     Returns:
         Normalized module name string
     """
+    if name in AVAILABLE_MODULE_NAMES:
+        return name
     return name.lower().strip()
 
 
 def get_module_class(name: str) -> Optional[type[Module]]:
     """Retrieve a module class by name.
 
-    Performs a case-insensitive lookup against AVAILABLE_MODULES.
+    Performs a case-insensitive lookup against the registry, importing the
+    module implementation on first use.
 
     Args:
         name: The module name to look up (case-insensitive)
@@ -89,13 +147,31 @@ def get_module_class(name: str) -> Optional[type[Module]]:
         >>> if module_cls:
         ...     module = module_cls(config)
     """
-    normalized = normalize_module_name(name)
-    return AVAILABLE_MODULES.get(normalized)
+    # Once the full registry has been built it is authoritative, so entries
+    # registered on it at runtime are honored
+    registry = globals().get("AVAILABLE_MODULES")
+    if registry is not None:
+        module_class = registry.get(name)
+        if module_class is None:
+            module_class = registry.get(name.lower().strip())
+        return module_class
+
+    module_class = _loaded_modules.get(name)
+    if module_class is not None:
+        return module_class
+
+    key = name if name in _MODULE_PATHS else name.lower().strip()
+    if key not in _MODULE_PATHS:
+        return None
+    return _load_module_class(key)
 
 
 def list_modules() -> list[str]:
     """Get a list of all available module names.
 
+    The registry is fixed at import time, so the names are sorted once;
+    each call returns a fresh list that callers may modify freely.
+
     Returns:
         Sorted list of module name strings
 
@@ -103,4 +179,4 @@ def list_modules() -> list[str]:
         >>> for name in list_modules():
         ...     print(f"Available: {name}")
     """
-    return sorted(AVAILABLE_MODULES.keys())
+    return list(_SORTED_MODULE_NAMES)
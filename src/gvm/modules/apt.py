@@ -7,17 +7,96 @@ system updates. It serves as the foundation module with no dependencies.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional
 
 from gvm.modules.base import Dependency, Module, ModuleResult, ModuleStatus
 from gvm.utils.files import safe_write
-from gvm.utils.shell import run
+from gvm.utils.shell import DPKG_CONFFILE_OPTIONS, apt_command, run, sudo_script
 
 if TYPE_CHECKING:
     from gvm.config import Config
 
+# Cache and list cleanup, run through one sudo shell so the globs are
+# expanded as root. The removals cover everything "apt clean" deletes, and
+# the partial directory apt expects is recreated afterwards. rm -f never
+# fails on a glob that matched nothing, so the steps chain with "&&".
+_CLEAN_APT_SCRIPT = (
+    "rm -rf /var/lib/apt/lists/*"
+    " && mkdir -p /var/lib/apt/lists/partial"
+    " && rm -rf /var/cache/apt/archives/partial/*"
+    " && rm -f /var/cache/apt/archives/*.deb /var/cache/apt/*.bin"
+)
+
+# Hardened APT drop-in, rendered by APTModule._build_apt_conf()
+_APT_CONF_TEMPLATE = """\
+// GVM robust APT configuration
+// Prevents failures on slow/unreliable connections
+
+Acquire::Retries "{retries}";
+Acquire::http::Timeout "{http_timeout}";
+Acquire::https::Timeout "{https_timeout}";
+Acquire::Queue-Mode "host";
+Dpkg::Use-Pty "0";
+"""
+
+# Appended only when apt.pipeline_depth is set
+_APT_CONF_PIPELINE_LINE = 'Acquire::http::Pipeline-Depth "{pipeline_depth}";\n'
+
+# Dry-run reports for the steps whose commands do not depend on settings,
+# each written to stdout in one call
+_DRY_RUN_CLEAN_APT = f"[DRY RUN] Would run: sudo sh -c '{_CLEAN_APT_SCRIPT}'\n"
+
+_DRY_RUN_REPAIR_DPKG = """\
+[DRY RUN] Would run:
+  sudo dpkg --configure -a
+  sudo apt-get -f install -y
+"""
+
+# Summary line of "apt-get -s dist-upgrade" in the C locale
+_UPGRADE_SUMMARY_RE = re.compile(
+    r"^(\d+) upgraded, (\d+) newly installed, (\d+) to remove", re.MULTILINE
+)
+
+_APT_LISTS_DIR = Path("/var/lib/apt/lists")
+
+# Set once dpkg has been found healthy (or repaired) in this process, so
+# later runs skip the audit and repair entirely
+_dpkg_healthy = False
+
+
+def _apt_index_fresh(max_age: int) -> bool:
+    """Check whether every downloaded Packages index is recent.
+
+    Args:
+        max_age: Maximum index age in seconds.
+
+    Returns:
+        True if at least one Packages index exists and all of them were
+        modified within max_age seconds, False otherwise.
+    """
+    cutoff = time.time() - max_age
+    found = False
+    try:
+        with os.scandir(_APT_LISTS_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_Packages"):
+                    continue
+                if entry.stat().st_mtime <= cutoff:
+                    return False
+                found = True
+    except OSError:
+        return False
+    return found
+
 
 class APTModule(Module):
     """Configure APT package manager with hardening and install base packages.
@@ -52,16 +131,33 @@ class APTModule(Module):
         super().__init__(config, verbose, dry_run)
         self.apt_conf_path = Path("/etc/apt/apt.conf.d/99-linuxvm-robust")
         self.mirrors_path = Path("/etc/apt/mirrors/debian.list")
+        # Kept out of apt.conf.d, where APT warns about unknown extensions
+        self.stamp_path = Path("/var/lib/gvm/apt.stamp")
+        self._sources_changed = False
 
     def is_installed(self) -> tuple[bool, str]:
-        """Check if APT hardening configuration is already present.
+        """Check if APT was configured and refreshed with the current settings.
+
+        A stamp written after each successful run records a digest of the
+        APT settings and when the run finished. The module counts as
+        installed while the digest matches and the stamp is younger than
+        ``apt.refresh_interval`` seconds, so repeat runs skip the whole
+        harden/update cycle.
 
         Returns:
             Tuple of (is_installed, message) indicating detection result.
         """
-        if self.apt_conf_path.exists():
-            return (True, "APT hardening configuration already present")
-        return (False, "APT hardening not configured")
+        if not self.apt_conf_path.exists():
+            return (False, "APT hardening not configured")
+
+        stamp = self._read_stamp()
+        if stamp is None or stamp[0] != self._settings_digest():
+            return (False, "APT settings changed since last run")
+
+        if time.time() - stamp[1] >= self.config.apt_refresh_interval:
+            return (False, "APT hardening present, package refresh due")
+
+        return (True, "APT configured and refreshed recently")
 
     def run(
         self,
@@ -80,17 +176,54 @@ class APTModule(Module):
                 progress_callback, 0.0, "Starting APT configuration"
             )
 
-            # Execute operations in sequence
-            self._harden_apt(progress_callback)
-            self._stabilize_mirrors(progress_callback)
-            self._clean_apt(progress_callback)
-            self._repair_dpkg(progress_callback)
-            self._update_upgrade(progress_callback)
+            # Authenticate once up front so the sudo calls that follow reuse
+            # the cached credentials instead of each going through PAM, and
+            # so no later step ever has to prompt for a password
+            if not self.dry_run and os.geteuid() != 0:
+                auth = run(["sudo", "-v"], check=False, verbose=self.verbose)
+                if auth.returncode != 0:
+                    raise SystemExit(
+                        "sudo authentication failed; APT configuration needs root"
+                    )
+
+            needs_repair: Optional[bool] = None
+            if self.dry_run:
+                self._harden_apt(progress_callback)
+                self._stabilize_mirrors(progress_callback)
+            else:
+                # dpkg --audit is read-only and needs no sudo, so it is the one
+                # step run in the background; both privileged writes stay on
+                # this thread
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    audit = executor.submit(self._dpkg_needs_repair)
+                    self._harden_apt(progress_callback)
+                    self._stabilize_mirrors(progress_callback)
+                    needs_repair = audit.result()
+
+            # An index younger than apt.update_max_age is kept as-is (e.g. when
+            # re-running after a partial install), unless the mirrors were just
+            # rewritten
+            index_fresh = not self._sources_changed and _apt_index_fresh(
+                self.config.apt_update_max_age
+            )
+            if index_fresh:
+                self._report_progress(
+                    progress_callback,
+                    0.4,
+                    "Package index is fresh",
+                    "Skipping cache cleanup and apt-get update",
+                )
+            else:
+                self._clean_apt(progress_callback)
+
+            self._repair_dpkg(progress_callback, needs_repair)
+            self._update_upgrade(progress_callback, refresh_index=not index_fresh)
 
             # Install base packages if configured
-            base_packages = self.config.apt.get("base_packages", [])
-            if base_packages:
-                self._install_packages(base_packages, progress_callback)
+            if self.config.apt_base_packages:
+                self._install_packages(
+                    list(self.config.apt_base_packages), progress_callback
+                )
             else:
                 self._report_progress(
                     progress_callback, 1.0, "APT configuration complete"
@@ -102,23 +235,32 @@ class APTModule(Module):
                     message="[DRY RUN] APT configuration and system update complete",
                 )
 
+            # The stamp only lets later runs be skipped; failing to record
+            # it must not turn a completed run into a failure
+            try:
+                self._write_stamp()
+            except (OSError, SystemExit) as e:
+                if self.verbose:
+                    print(f"Warning: could not record APT run stamp: {e}")
+
             return ModuleResult(
                 status=ModuleStatus.SUCCESS,
                 message="APT configuration and system update complete",
             )
 
+        # Tracebacks are only formatted when verbose output was requested
         except SystemExit as e:
             return ModuleResult(
                 status=ModuleStatus.FAILED,
                 message=str(e),
-                details=traceback.format_exc(),
+                details=traceback.format_exc() if self.verbose else None,
                 recovery_command=self.get_recovery_command(),
             )
         except Exception as e:
             return ModuleResult(
                 status=ModuleStatus.FAILED,
                 message=str(e),
-                details=traceback.format_exc(),
+                details=traceback.format_exc() if self.verbose else None,
                 recovery_command=self.get_recovery_command(),
             )
 
@@ -130,6 +272,56 @@ class APTModule(Module):
         """
         return "gvm fix apt"
 
+    def _build_apt_conf(self) -> str:
+        """Render the hardened APT configuration from current settings.
+
+        Returns:
+            Contents for the apt.conf.d drop-in.
+        """
+        content = _APT_CONF_TEMPLATE.format(
+            retries=self.config.apt_retries,
+            http_timeout=self.config.apt_http_timeout,
+            https_timeout=self.config.apt_https_timeout,
+        )
+        # Pipelining is left at APT's default unless explicitly configured
+        if self.config.apt_pipeline_depth is not None:
+            content += _APT_CONF_PIPELINE_LINE.format(
+                pipeline_depth=self.config.apt_pipeline_depth
+            )
+        return content
+
+    def _settings_digest(self) -> str:
+        """Hash everything that influences what a run would do.
+
+        Returns:
+            Hex SHA-256 of the rendered APT config and the apt section.
+        """
+        digest = hashlib.sha256(self._build_apt_conf().encode())
+        digest.update(json.dumps(self.config.apt, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _read_stamp(self) -> Optional[tuple[str, float]]:
+        """Read the digest and timestamp left by the last successful run.
+
+        Returns:
+            Tuple of (digest, timestamp), or None if the stamp is missing
+            or unreadable.
+        """
+        try:
+            digest, timestamp = self.stamp_path.read_text().split()
+            return (digest, float(timestamp))
+        except (OSError, ValueError):
+            return None
+
+    def _write_stamp(self) -> None:
+        """Record the current settings digest and time after a successful run."""
+        safe_write(
+            self.stamp_path,
+            f"{self._settings_digest()}\n{int(time.time())}\n",
+            backup=False,
+            mode=0o644,
+        )
+
     def _harden_apt(
         self,
         progress_callback: Callable[[float, str, Optional[str]], None],
@@ -146,91 +338,69 @@ class APTModule(Module):
             "Creating robust APT config",
         )
 
-        # Build config content from settings
-        content = f'''// GVM robust APT configuration
-// Prevents failures on slow/unreliable connections
-
-Acquire::Retries "{self.config.apt_retries}";
-Acquire::http::Timeout "{self.config.apt_http_timeout}";
-Acquire::https::Timeout "{self.config.apt_https_timeout}";
-Acquire::http::Pipeline-Depth "0";
-Dpkg::Use-Pty "0";
-'''
+        content = self._build_apt_conf()
 
         if self.dry_run:
-            print(f"[DRY RUN] Would write APT config to {self.apt_conf_path}:")
-            print(content)
+            print(f"[DRY RUN] Would write APT config to {self.apt_conf_path}:\n{content}")
             self._report_progress(
                 progress_callback, 0.2, "APT hardening complete (dry run)"
             )
             return
 
-        safe_write(self.apt_conf_path, content, backup=True, mode=0o644)
+        # Re-runs usually find the same config on disk; safe_write() skips
+        # the backup and rewrite entirely in that case
+        if not safe_write(self.apt_conf_path, content, backup=True, mode=0o644):
+            self._report_progress(
+                progress_callback,
+                0.2,
+                "APT hardening complete",
+                "Configuration already up to date",
+            )
+            return
 
         self._report_progress(
             progress_callback, 0.2, "APT hardening complete"
         )
 
-    def _extract_urls_from_mirror_file(self) -> list[str]:
-        """Extract valid URLs from the mirror file, handling corrupted entries.
+    @staticmethod
+    def _extract_urls_from_mirror_file(content: str) -> tuple[list[str], bool]:
+        """Extract mirror URLs from mirror file content and detect corruption.
 
-        For corrupted lines (URL + suite + components), extracts just the URL.
-        For valid lines (just URL), keeps them as-is.
+        A corrupted mirror file contains full source entries (URL + suite +
+        components) instead of just URLs. This was caused by a bug in earlier
+        versions. For corrupted lines, just the URL is extracted; valid
+        lines (just URL) are kept as-is.
+
+        Args:
+            content: Text of the mirror file.
 
         Returns:
-            List of unique mirror URLs extracted from the file.
+            Tuple of (urls, was_corrupted) where urls lists the unique mirror
+            URLs found in the file.
         """
-        if not self.mirrors_path.exists():
-            return []
-
+        corrupted = False
         urls: list[str] = []
-        try:
-            content = self.mirrors_path.read_text()
-            for line in content.strip().split("\n"):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # If line contains spaces, it's corrupted - extract just the URL
-                if " " in line:
-                    url = line.split()[0]
-                else:
-                    url = line
-
-                # Validate it looks like a URL
-                if url.startswith(("http://", "https://")):
-                    if url not in urls:
-                        urls.append(url)
-        except (OSError, IOError):
-            pass
-
-        return urls
-
-    def _is_mirror_file_corrupted(self) -> bool:
-        """Check if the mirror file has corrupted format.
-
-        A corrupted mirror file contains full source entries (URL + suite + components)
-        instead of just URLs. This was caused by a bug in earlier versions.
+        seen: set[str] = set()
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            # A valid mirror file line should be just a URL. A corrupted
+            # line contains spaces (URL + suite + components), so extract
+            # just the URL
+            if " " in line:
+                corrupted = True
+                url = line.split()[0]
+            else:
+                url = line
 
-        Returns:
-            True if the file appears corrupted, False otherwise.
-        """
-        if not self.mirrors_path.exists():
-            return False
+            # Validate it looks like a URL
+            if url.startswith(("http://", "https://")) and url not in seen:
+                seen.add(url)
+                urls.append(url)
 
-        try:
-            content = self.mirrors_path.read_text()
-            for line in content.strip().split("\n"):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                # A valid mirror file line should be just a URL
-                # A corrupted line contains spaces (URL + suite + components)
-                if " " in line:
-                    return True
-            return False
-        except (OSError, IOError):
-            return False
+        return (urls, corrupted)
 
     def _stabilize_mirrors(
         self,
@@ -256,8 +426,10 @@ Dpkg::Use-Pty "0";
             "Checking mirror configuration",
         )
 
-        # Check if mirrors file exists
-        if not self.mirrors_path.exists():
+        # Read the mirrors file once; every check below works on this text
+        try:
+            mirror_content = self.mirrors_path.read_text()
+        except FileNotFoundError:
             self._report_progress(
                 progress_callback,
                 0.3,
@@ -265,9 +437,25 @@ Dpkg::Use-Pty "0";
                 "No mirrors file present",
             )
             return
+        except OSError:
+            self._report_progress(
+                progress_callback,
+                0.3,
+                "Mirror stabilization skipped",
+                "Mirrors file could not be read",
+            )
+            return
 
-        # Check if repair is needed
-        if not self._is_mirror_file_corrupted():
+        # Only corrupted lines contain spaces, so content without any space
+        # is accepted after a single substring scan; otherwise one parse
+        # both detects corruption and recovers the original URLs
+        corrupted = False
+        if " " in mirror_content:
+            extracted_urls, corrupted = self._extract_urls_from_mirror_file(
+                mirror_content
+            )
+
+        if not corrupted:
             self._report_progress(
                 progress_callback,
                 0.3,
@@ -276,7 +464,6 @@ Dpkg::Use-Pty "0";
             )
             return
 
-        # Extract URLs from corrupted file to restore original mirrors
         self._report_progress(
             progress_callback,
             0.27,
@@ -284,12 +471,11 @@ Dpkg::Use-Pty "0";
             "Extracting original URLs from malformed entries...",
         )
 
-        extracted_urls = self._extract_urls_from_mirror_file()
-
         if not extracted_urls:
             # Fallback to config mirrors if extraction fails
-            mirrors = self.config.apt.get("mirrors", [])
-            extracted_urls = [m for m in mirrors if "security" not in m]
+            extracted_urls = [
+                m for m in self.config.apt_mirrors if "security" not in m
+            ]
 
         if not extracted_urls:
             self._report_progress(
@@ -304,15 +490,18 @@ Dpkg::Use-Pty "0";
         content = "\n".join(extracted_urls) + "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would repair mirrors file {self.mirrors_path}:")
-            print(f"  Extracted URLs: {extracted_urls}")
-            print(f"  New content:\n{content}")
+            print(
+                f"[DRY RUN] Would repair mirrors file {self.mirrors_path}:\n"
+                f"  Extracted URLs: {extracted_urls}\n"
+                f"  New content:\n{content}"
+            )
             self._report_progress(
                 progress_callback, 0.3, "Mirror repair complete (dry run)"
             )
             return
 
         safe_write(self.mirrors_path, content, backup=True)
+        self._sources_changed = True
 
         self._report_progress(
             progress_callback, 0.3, "Mirror file repaired"
@@ -335,44 +524,14 @@ Dpkg::Use-Pty "0";
         )
 
         if self.dry_run:
-            print("[DRY RUN] Would run:")
-            print("  sudo apt clean")
-            print("  sudo bash -c 'rm -rf /var/lib/apt/lists/*'")
-            print("  sudo mkdir -p /var/lib/apt/lists/partial")
-            print("  sudo bash -c 'rm -rf /var/cache/apt/archives/partial/*'")
-            print("  sudo bash -c 'rm -f /var/cache/apt/archives/*.deb'")
+            sys.stdout.write(_DRY_RUN_CLEAN_APT)
             self._report_progress(
                 progress_callback, 0.4, "APT cache cleaned (dry run)"
             )
             return
 
-        # Clean APT cache
-        run(["sudo", "apt", "clean"], check=False, verbose=self.verbose)
-
-        # Remove apt lists (use bash -c for glob expansion)
         run(
-            ["sudo", "bash", "-c", "rm -rf /var/lib/apt/lists/*"],
-            check=False,
-            verbose=self.verbose,
-        )
-
-        # Recreate partial directory
-        run(
-            ["sudo", "mkdir", "-p", "/var/lib/apt/lists/partial"],
-            check=False,
-            verbose=self.verbose,
-        )
-
-        # Clean partial archives (use bash -c for glob expansion)
-        run(
-            ["sudo", "bash", "-c", "rm -rf /var/cache/apt/archives/partial/*"],
-            check=False,
-            verbose=self.verbose,
-        )
-
-        # Remove cached deb files (use bash -c for glob expansion)
-        run(
-            ["sudo", "bash", "-c", "rm -f /var/cache/apt/archives/*.deb"],
+            ["sudo", "sh", "-c", _CLEAN_APT_SCRIPT],
             check=False,
             verbose=self.verbose,
         )
@@ -384,11 +543,14 @@ Dpkg::Use-Pty "0";
     def _repair_dpkg(
         self,
         progress_callback: Callable[[float, str, Optional[str]], None],
+        needs_repair: Optional[bool] = None,
     ) -> None:
         """Repair dpkg and APT state.
 
         Args:
             progress_callback: Callback to report progress.
+            needs_repair: Result of an earlier _dpkg_needs_repair() call,
+                or None to run the audit here.
         """
         self._report_progress(
             progress_callback,
@@ -398,70 +560,138 @@ Dpkg::Use-Pty "0";
         )
 
         if self.dry_run:
-            print("[DRY RUN] Would run:")
-            print("  sudo dpkg --configure -a")
-            print("  sudo apt -f install -y")
+            sys.stdout.write(_DRY_RUN_REPAIR_DPKG)
             self._report_progress(
                 progress_callback, 0.5, "DPKG repair complete (dry run)"
             )
             return
 
-        # Configure any unconfigured packages
-        run(
-            ["sudo", "dpkg", "--configure", "-a"],
-            check=False,
-            verbose=self.verbose,
-        )
+        if needs_repair is None:
+            needs_repair = self._dpkg_needs_repair()
 
-        # Fix broken dependencies
-        run(
-            ["sudo", "apt", "-f", "install", "-y"],
+        if not needs_repair:
+            self._report_progress(
+                progress_callback, 0.5, "DPKG state OK", "No repair needed"
+            )
+            return
+
+        # Configure any unconfigured packages, then fix broken dependencies,
+        # under one sudo; the fix runs even if configuring failed
+        result = run(
+            sudo_script(
+                [
+                    ["dpkg", "--configure", "-a"],
+                    apt_command(
+                        "apt-get", *DPKG_CONFFILE_OPTIONS, "-f", "install", "-y",
+                        quiet=not self.verbose, sudo=False,
+                    ),
+                ],
+                stop_on_error=False,
+            ),
             check=False,
             verbose=self.verbose,
         )
 
+        # _dpkg_healthy is deliberately left alone: the next dpkg --audit
+        # decides whether the repair actually worked
+        if result.returncode != 0:
+            self._report_progress(
+                progress_callback,
+                0.5,
+                "DPKG repair incomplete",
+                f"Repair commands exited with status {result.returncode}",
+            )
+            return
+
         self._report_progress(
             progress_callback, 0.5, "DPKG repair complete"
         )
 
+    def _dpkg_needs_repair(self) -> bool:
+        """Check whether dpkg has half-installed or unconfigured packages.
+
+        ``dpkg --audit`` is read-only, needs no sudo and returns quickly on a
+        clean database. It prints nothing (and newer versions exit 0) when
+        there is nothing to fix.
+
+        Returns:
+            True if the repair commands should run, False otherwise.
+        """
+        global _dpkg_healthy
+        if _dpkg_healthy:
+            return False
+
+        result = run(
+            ["dpkg", "--audit"],
+            check=False,
+            capture=True,
+            verbose=self.verbose,
+        )
+        if result.returncode == 0 and not (result.stdout or "").strip():
+            _dpkg_healthy = True
+            return False
+        return True
+
     def _update_upgrade(
         self,
         progress_callback: Callable[[float, str, Optional[str]], None],
+        refresh_index: bool = True,
     ) -> None:
         """Update package index and upgrade system.
 
         Args:
             progress_callback: Callback to report progress.
+            refresh_index: If False, reuse the current package index and
+                skip apt-get update.
         """
         self._report_progress(
             progress_callback,
             0.55,
             "Updating package index",
-            "Running apt update",
+            "Running apt-get update" if refresh_index else "Package index is fresh",
         )
 
         if self.dry_run:
-            print("[DRY RUN] Would run:")
-            print("  sudo apt update")
-            print("  sudo apt -y full-upgrade")
+            lines = ["[DRY RUN] Would run:"]
+            if refresh_index:
+                lines.append("  sudo apt-get update")
+            lines.append("  sudo apt-get -y dist-upgrade")
+            print("\n".join(lines))
             self._report_progress(
                 progress_callback, 0.85, "System update complete (dry run)"
             )
             return
 
         # Update package index
-        run(["sudo", "apt", "update"], check=True, verbose=self.verbose)
+        if refresh_index:
+            run(
+                apt_command("apt-get", "update", quiet=not self.verbose),
+                check=True,
+                verbose=self.verbose,
+            )
+
+        if not self._upgrade_pending():
+            self._report_progress(
+                progress_callback,
+                0.85,
+                "System packages up to date",
+                "Nothing to upgrade",
+            )
+            return
 
         self._report_progress(
             progress_callback,
             0.7,
             "Upgrading system packages",
-            "Running apt full-upgrade",
+            "Running apt-get dist-upgrade",
         )
 
         # Perform full upgrade
         run(
-            ["sudo", "apt", "-y", "full-upgrade"],
+            apt_command(
+                "apt-get", *DPKG_CONFFILE_OPTIONS, "-y", "dist-upgrade",
+                quiet=not self.verbose,
+            ),
             check=True,
             verbose=self.verbose,
         )
@@ -470,15 +700,39 @@ Dpkg::Use-Pty "0";
             progress_callback, 0.85, "System update complete"
         )
 
+    def _upgrade_pending(self) -> bool:
+        """Check whether dist-upgrade would change anything.
+
+        A simulated dist-upgrade needs no root and no downloads, so
+        re-runs on an up-to-date system skip the real one entirely.
+
+        Returns:
+            False if the simulation reports no upgrades, installs or
+            removals, True otherwise (including when it cannot be parsed).
+        """
+        result = run(
+            ["apt-get", "-s", "-y", "dist-upgrade"],
+            check=False,
+            capture=True,
+            verbose=self.verbose,
+            env={"LC_ALL": "C"},
+        )
+        match = _UPGRADE_SUMMARY_RE.search(result.stdout or "")
+        if result.returncode != 0 or match is None:
+            return True
+        return any(int(count) for count in match.groups())
+
     def _install_packages(
         self,
         packages: list[str],
         progress_callback: Callable[[float, str, Optional[str]], None],
     ) -> None:
-        """Install packages using download-first strategy.
+        """Install packages in a single apt-get transaction.
 
-        This downloads all packages first, then installs from cache
-        to minimize network issues during installation.
+        apt already discards partial downloads and configures nothing when a
+        fetch fails, and retries come from the hardened APT config. When
+        ``apt.prefetch`` is enabled, everything is downloaded in a separate
+        pass first and then installed from cache.
 
         Args:
             packages: List of package names to install.
@@ -487,40 +741,57 @@ Dpkg::Use-Pty "0";
         if not packages:
             return
 
-        self._report_progress(
-            progress_callback,
-            0.9,
-            "Downloading packages",
-            f"Prefetching {len(packages)} packages",
-        )
-
         if self.dry_run:
+            self._report_progress(
+                progress_callback,
+                0.9,
+                "Installing packages",
+                f"Installing {len(packages)} packages",
+            )
             print(f"[DRY RUN] Would install packages: {', '.join(packages)}")
             self._report_progress(
                 progress_callback, 1.0, "Package installation complete (dry run)"
             )
             return
 
-        # Download packages first
-        run(
-            ["sudo", "apt-get", "-y", "--download-only", "install"] + packages,
-            check=True,
-            verbose=self.verbose,
-        )
+        # Keep existing conffiles without prompting and, unless asked for,
+        # skip Recommends, which often doubles the download
+        options = ["-y", *DPKG_CONFFILE_OPTIONS]
+        if not self.config.apt_install_recommends:
+            options.append("--no-install-recommends")
 
-        self._report_progress(
-            progress_callback,
-            0.95,
-            "Installing packages",
-            f"Installing {len(packages)} packages from cache",
-        )
+        quiet = not self.verbose
+        if self.config.apt_prefetch:
+            self._report_progress(
+                progress_callback,
+                0.9,
+                "Downloading and installing packages",
+                f"Prefetching {len(packages)} packages, then installing",
+            )
 
-        # Install from cache
-        run(
-            ["sudo", "apt-get", "-y", "--no-download", "install"] + packages,
-            check=True,
-            verbose=self.verbose,
-        )
+            # Download everything first, then install from cache, chained
+            # under one sudo so the install only starts once all fetches
+            # succeeded
+            cmd = sudo_script([
+                apt_command(
+                    "apt-get", *options, "--download-only", "install", *packages,
+                    quiet=quiet, sudo=False,
+                ),
+                apt_command(
+                    "apt-get", *options, "--no-download", "install", *packages,
+                    quiet=quiet, sudo=False,
+                ),
+            ])
+        else:
+            self._report_progress(
+                progress_callback,
+                0.9,
+                "Installing packages",
+                f"Installing {len(packages)} packages",
+            )
+            cmd = apt_command("apt-get", *options, "install", *packages, quiet=quiet)
+
+        run(cmd, check=True, verbose=self.verbose)
 
         self._report_progress(
             progress_callback, 1.0, "Package installation complete"
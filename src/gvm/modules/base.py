@@ -33,18 +33,27 @@ Example Usage:
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
 if TYPE_CHECKING:
     from gvm.config import Config
 
+# Repeats of the same progress message are dropped unless at least this much
+# time (seconds) or progress has passed since the last one was emitted
+_PROGRESS_MIN_INTERVAL = 0.05
+_PROGRESS_MIN_STEP = 0.01
 
-class ModuleStatus(Enum):
+
+class ModuleStatus(StrEnum):
     """Execution status for module operations.
 
+    Members are strings, so they compare equal to their values
+    (e.g. ``ModuleStatus.SUCCESS == "success"``).
+
     Attributes:
         SUCCESS: Module executed successfully without errors
         FAILED: Module execution failed with an error
@@ -56,7 +65,7 @@ class ModuleStatus(Enum):
     SKIPPED = "skipped"
 
 
-class RecoveryAction(Enum):
+class RecoveryAction(StrEnum):
     """Actions available during interactive error recovery.
 
     When a module fails, the orchestrator can prompt the user to choose
@@ -73,7 +82,7 @@ class RecoveryAction(Enum):
     ABORT = "abort"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Dependency:
     """Represents a dependency relationship between modules.
 
@@ -88,7 +97,7 @@ class Dependency:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModuleResult:
     """Result of a module execution.
 
@@ -154,6 +163,20 @@ class Module(ABC):
     description: str = ""
     dependencies: Sequence[Dependency] = ()
 
+    # Normalized names from dependencies, derived per subclass
+    dependency_names: frozenset[str] = frozenset()
+    required_dependency_names: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Derive the dependency name sets from the declared dependencies."""
+        super().__init_subclass__(**kwargs)
+        cls.dependency_names = frozenset(
+            dep.module_name.lower().strip() for dep in cls.dependencies
+        )
+        cls.required_dependency_names = frozenset(
+            dep.module_name.lower().strip() for dep in cls.dependencies if dep.required
+        )
+
     def __init__(
         self,
         config: Config,
@@ -170,6 +193,8 @@ class Module(ABC):
         self.config = config
         self.verbose = verbose
         self.dry_run = dry_run
+        # (time, percent, message) of the last progress update emitted
+        self._last_progress: Optional[tuple[float, float, str]] = None
 
     @abstractmethod
     def is_installed(self) -> tuple[bool, str]:
@@ -194,7 +219,7 @@ class Module(ABC):
     @abstractmethod
     def run(
         self,
-        progress_callback: Callable[[float, str, Optional[str]], None],
+        progress_callback: Optional[Callable[[float, str, Optional[str]], None]],
     ) -> ModuleResult:
         """Execute the module's main functionality.
 
@@ -207,6 +232,7 @@ class Module(ABC):
                 - percent (float): Progress from 0.0 to 1.0
                 - message (str): Module-level status message (always shown)
                 - operation (Optional[str]): Detailed operation info (verbose only)
+                None when nobody is listening; _report_progress then does nothing.
 
         Returns:
             ModuleResult containing:
@@ -243,6 +269,9 @@ class Module(ABC):
 
         This helper method validates the percent value, handles None callbacks
         gracefully, and respects the verbose flag for operation details.
+        Bursts of updates that repeat the previous message within a few
+        milliseconds and a fraction of a percent are coalesced; the first
+        (0.0) and final (1.0) updates are always emitted.
 
         Args:
             callback: Progress callback function, or None for no-op
@@ -259,6 +288,18 @@ class Module(ABC):
         if not 0.0 <= percent <= 1.0:
             raise ValueError(f"Progress percent must be between 0.0 and 1.0, got {percent}")
 
+        now = time.monotonic()
+        last = self._last_progress
+        if (
+            last is not None
+            and percent not in (0.0, 1.0)
+            and message == last[2]
+            and now - last[0] < _PROGRESS_MIN_INTERVAL
+            and abs(percent - last[1]) < _PROGRESS_MIN_STEP
+        ):
+            return
+        self._last_progress = (now, percent, message)
+
         # Only pass operation details if verbose mode is enabled
         operation_detail = operation if self.verbose else None
         callback(percent, message, operation_detail)
@@ -2,7 +2,7 @@
 
 This module installs and configures desktop environments on the VM.
 It dynamically loads desktop configurations from TOML files, installs
-packages using APT with a download-first strategy, creates configuration
+packages using APT in a single transaction, creates configuration
 files with path expansion, and generates helper launch scripts.
 """
 
@@ -15,14 +15,18 @@ import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional
 
-from gvm.config import DesktopConfig
+from gvm.config import USER_CONFIG_DIR, DesktopConfig
 from gvm.modules.base import Dependency, Module, ModuleResult, ModuleStatus
-from gvm.utils.files import safe_write
-from gvm.utils.shell import run
+from gvm.utils.files import requires_sudo, safe_write, safe_write_many
+from gvm.utils.shell import DPKG_CONFFILE_OPTIONS, apt_command, run
 
 if TYPE_CHECKING:
     from gvm.config import Config
 
+# Valid shell identifier: starts with letter or underscore, followed by
+# alphanumerics or underscores
+_ENV_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 
 class DesktopModule(Module):
     """Install and configure desktop environments.
@@ -30,7 +34,7 @@ class DesktopModule(Module):
     This module depends on the APT module for package installation.
     It performs the following operations:
     1. Discover available desktop configurations
-    2. Install desktop packages using download-first strategy
+    2. Install desktop packages in a single APT transaction
     3. Create configuration files from templates
     4. Generate helper launch scripts
     """
@@ -72,9 +76,8 @@ class DesktopModule(Module):
         """
         # If specific desktop requested, check if its core packages are installed
         if self.desktop_name:
-            desktops = self.config.discover_desktops()
-            if self.desktop_name in desktops:
-                desktop = desktops[self.desktop_name]
+            desktop = self.config.get_desktop(self.desktop_name)
+            if desktop is not None:
                 if desktop.packages_core and self._check_packages_installed(desktop.packages_core):
                     return (True, f"Desktop '{self.desktop_name}' is already installed")
             return (False, f"Desktop '{self.desktop_name}' not installed")
@@ -113,7 +116,10 @@ class DesktopModule(Module):
                 return ModuleResult(
                     status=ModuleStatus.FAILED,
                     message="No desktop configurations found",
-                    details="No TOML files with 'meta.type = desktop' found in config/packages or ~/.config/gvm/packages",
+                    details=(
+                        "No TOML files with 'meta.type = desktop' found in "
+                        f"config/packages or {USER_CONFIG_DIR / 'packages'}"
+                    ),
                     recovery_command=self.get_recovery_command(),
                 )
 
@@ -152,34 +158,32 @@ class DesktopModule(Module):
                     recovery_command=self.get_recovery_command(),
                 )
 
+            # Install packages for every selected desktop in a single apt
+            # transaction so the solver, index load, and dpkg triggers run once
+            self._install_desktop_packages(
+                list(desktops_to_install.values()), progress_callback
+            )
+
             installed_names: list[str] = []
             total_desktops = len(desktops_to_install)
 
             for idx, (name, desktop) in enumerate(desktops_to_install.items()):
-                base_progress = idx / total_desktops
-                progress_scale = 1.0 / total_desktops
-
-                # Install packages
-                self._report_progress(
-                    progress_callback,
-                    base_progress + 0.1 * progress_scale,
-                    f"Installing packages for {name}",
-                    f"Processing {desktop.description or name}",
-                )
-                self._install_desktop_packages(desktop, progress_callback, base_progress, progress_scale)
+                base_progress = 0.5 + 0.4 * idx / total_desktops
+                progress_scale = 0.4 / total_desktops
 
                 # Create configuration files
                 self._report_progress(
                     progress_callback,
-                    base_progress + 0.5 * progress_scale,
+                    base_progress,
                     f"Creating configuration files for {name}",
+                    f"Processing {desktop.description or name}",
                 )
                 self._create_desktop_files(desktop, progress_callback)
 
                 # Create helper launch script
                 self._report_progress(
                     progress_callback,
-                    base_progress + 0.8 * progress_scale,
+                    base_progress + 0.5 * progress_scale,
                     f"Creating helper launch script for {name}",
                 )
                 self._create_helper_script(desktop, progress_callback)
@@ -227,82 +231,78 @@ class DesktopModule(Module):
 
     def _install_desktop_packages(
         self,
-        desktop: DesktopConfig,
+        desktops: list[DesktopConfig],
         progress_callback: Callable[[float, str, Optional[str]], None],
-        base_progress: float = 0.0,
-        progress_scale: float = 1.0,
     ) -> None:
-        """Install packages for a desktop environment using download-first strategy.
+        """Install packages for one or more desktops in a single apt transaction.
+
+        Package lists from all desktops are merged (duplicates removed, order
+        preserved) and passed to one ``apt-get install`` call, so apt loads
+        its index and resolves dependencies only once.
 
         Args:
-            desktop: Desktop configuration with package lists.
+            desktops: Desktop configurations whose packages should be installed.
             progress_callback: Callback to report progress.
-            base_progress: Base progress value for this operation.
-            progress_scale: Scale factor for progress increments.
         """
-        packages = desktop.get_all_packages()
+        names = ", ".join(desktop.name for desktop in desktops)
+        packages = list(
+            dict.fromkeys(
+                package
+                for desktop in desktops
+                for package in desktop.get_all_packages()
+            )
+        )
 
         if not packages:
             self._report_progress(
                 progress_callback,
-                base_progress + 0.4 * progress_scale,
-                f"No packages to install for {desktop.name}",
+                0.4,
+                f"No packages to install for {names}",
             )
             return
 
         self._report_progress(
             progress_callback,
-            base_progress + 0.15 * progress_scale,
-            f"Downloading {len(packages)} packages for {desktop.name}",
-            "Prefetching packages to cache",
+            0.1,
+            f"Installing {len(packages)} packages for {names}",
+            f"Running apt-get install for {len(packages)} packages",
         )
 
         if self.dry_run:
-            print(f"[DRY RUN] Would download packages: {', '.join(packages)}")
-            print("[DRY RUN] Would install packages from cache")
+            print(f"[DRY RUN] Would install packages: {', '.join(packages)}")
             self._report_progress(
                 progress_callback,
-                base_progress + 0.4 * progress_scale,
-                f"Package installation complete for {desktop.name} (dry run)",
+                0.4,
+                f"Package installation complete for {names} (dry run)",
             )
             return
 
-        # Download packages first
-        run(
-            ["sudo", "apt-get", "-y", "--download-only", "install"] + packages,
-            check=True,
-            verbose=self.verbose,
-        )
-
-        self._report_progress(
-            progress_callback,
-            base_progress + 0.3 * progress_scale,
-            f"Installing {len(packages)} packages from cache",
-            f"Installing packages for {desktop.name}",
-        )
-
-        # Install from cache
         run(
-            ["sudo", "apt-get", "-y", "--no-download", "install"] + packages,
+            apt_command(
+                "apt-get",
+                "-y",
+                *DPKG_CONFFILE_OPTIONS,
+                "install",
+                *packages,
+                quiet=not self.verbose,
+            ),
             check=True,
             verbose=self.verbose,
         )
 
         # Disable any display managers that might have been installed as dependencies
         # We use direct session start via gvm start, not a display manager
-        self._disable_display_managers(progress_callback, base_progress, progress_scale)
+        self._disable_display_managers(progress_callback)
 
         self._report_progress(
             progress_callback,
-            base_progress + 0.4 * progress_scale,
-            f"Package installation complete for {desktop.name}",
+            0.4,
+            f"Package installation complete for {names}",
         )
 
     def _disable_display_managers(
         self,
         progress_callback: Callable[[float, str, Optional[str]], None],
-        base_progress: float,
-        progress_scale: float,
     ) -> None:
         """Disable any display managers that might have been installed.
 
@@ -311,14 +311,12 @@ class DesktopModule(Module):
 
         Args:
             progress_callback: Callback to report progress.
-            base_progress: Base progress value for this operation.
-            progress_scale: Scale factor for progress increments.
         """
         display_managers = ["lightdm", "gdm3", "sddm", "lxdm", "nodm"]
 
         self._report_progress(
             progress_callback,
-            base_progress + 0.35 * progress_scale,
+            0.35,
             "Disabling display managers",
             "Checking for installed display managers",
         )
@@ -365,6 +363,9 @@ class DesktopModule(Module):
         if not desktop.files:
             return
 
+        # System files are collected and written together under one sudo call
+        system_files: list[tuple[Path, str, int]] = []
+
         for file_path, content in desktop.files.items():
             # Expand path: handle ~ and environment variables
             expanded_path = Path(file_path).expanduser()
@@ -380,7 +381,14 @@ class DesktopModule(Module):
                 print(f"[DRY RUN] Content preview:\n{preview}")
                 continue
 
-            safe_write(expanded_path, content.rstrip("\n") + "\n", backup=True, mode=mode)
+            content = content.rstrip("\n") + "\n"
+            if requires_sudo(expanded_path):
+                system_files.append((expanded_path, content, mode))
+            else:
+                safe_write(expanded_path, content, backup=True, mode=mode)
+
+        if system_files:
+            safe_write_many(system_files, backup=True)
 
     def _create_helper_script(
         self,
@@ -460,15 +468,12 @@ class DesktopModule(Module):
         # Export environment variables
         if desktop.environment_vars:
             lines.append("# Environment variables for this desktop")
-            # Regex for valid shell identifier: starts with letter or underscore,
-            # followed by alphanumerics or underscores
-            valid_key_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
             for var in desktop.environment_vars:
                 # Validate and quote environment variable assignments
                 if "=" in var:
                     key, value = var.split("=", 1)
                     # Validate key is a safe shell identifier
-                    if not valid_key_pattern.match(key):
+                    if not _ENV_KEY_RE.match(key):
                         print(f"Warning: Skipping invalid env var key: {key!r}")
                         continue
                     # Use shlex.quote for shell-safe quoting (handles single quotes, etc.)
@@ -476,7 +481,7 @@ class DesktopModule(Module):
                 else:
                     # Variable reference without value (export existing var)
                     # Validate the variable name
-                    if not valid_key_pattern.match(var):
+                    if not _ENV_KEY_RE.match(var):
                         print(f"Warning: Skipping invalid env var name: {var!r}")
                         continue
                     lines.append(f"export {var}")
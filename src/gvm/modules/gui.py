@@ -19,6 +19,14 @@ from gvm.utils.files import ensure_snippet, safe_write
 if TYPE_CHECKING:
     from gvm.config import Config
 
+# Valid shell identifier: starts with letter or underscore, followed by
+# alphanumerics or underscores
+_ENV_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Characters outside the script filename whitelist, and runs of hyphens
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_HYPHEN_RUN_RE = re.compile(r"-+")
+
 
 class GUIModule(Module):
     """Create GUI helper scripts for desktop environment launching.
@@ -251,10 +259,10 @@ echo ""
         filename = filename.lstrip(".")
 
         # Whitelist characters: only allow alphanumeric, hyphen, underscore
-        filename = re.sub(r"[^a-zA-Z0-9_-]", "-", filename)
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub("-", filename)
 
         # Collapse repeated hyphens and trim leading/trailing hyphens
-        filename = re.sub(r"-+", "-", filename).strip("-")
+        filename = _HYPHEN_RUN_RE.sub("-", filename).strip("-")
 
         # Ensure non-empty filename
         if not filename:
@@ -376,21 +384,18 @@ unset LIBGL_ALWAYS_INDIRECT
 # Set environment variables for this desktop
 '''
             # Add environment variables if defined
-            # Regex for valid shell identifier: starts with letter or underscore,
-            # followed by alphanumerics or underscores
-            valid_key_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
             for env_var in desktop.environment_vars:
                 if "=" in env_var:
                     key, value = env_var.split("=", 1)
                     # Validate key is a safe shell identifier
-                    if not valid_key_pattern.match(key):
+                    if not _ENV_KEY_RE.match(key):
                         print(f"Warning: Skipping invalid env var key in {desktop_name}: {key!r}")
                         continue
                     # Use shlex.quote for shell-safe quoting
                     content += f'export {key}={shlex.quote(value)}\n'
                 else:
                     # Variable reference without value - validate the name
-                    if not valid_key_pattern.match(env_var):
+                    if not _ENV_KEY_RE.match(env_var):
                         print(f"Warning: Skipping invalid env var name in {desktop_name}: {env_var!r}")
                         continue
                     content += f'export {env_var}\n'
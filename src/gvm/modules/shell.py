@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Callable, Optional
 
 from gvm.modules.base import Dependency, Module, ModuleResult, ModuleStatus
 from gvm.utils.files import ensure_snippet, safe_write
-from gvm.utils.shell import run
+from gvm.utils.shell import apt_command, run
 
 if TYPE_CHECKING:
     from gvm.config import Config
@@ -175,7 +175,9 @@ class ShellModule(Module):
             return
 
         run(
-            ["sudo", "apt-get", "-y", "install", "starship"],
+            apt_command(
+                "apt-get", "-y", "install", "starship", quiet=not self.verbose
+            ),
             check=True,
             verbose=self.verbose,
         )
@@ -262,16 +264,20 @@ case $- in
 esac
 
 # Display banner
+# Hostname and kernel come from the shell and procfs so that only uptime
+# and memory need a subprocess on each login
 display_banner() {{
+    local kernel=N/A
+    {{ read -r kernel < /proc/sys/kernel/osrelease; }} 2>/dev/null
     echo ""
     echo "====================================="
     echo "  "{title_escaped}
     echo "====================================="
     echo ""
-    echo "  Hostname:  $(hostname)"
-    echo "  Kernel:    $(uname -r)"
+    echo "  Hostname:  ${{HOSTNAME:-$(hostname)}}"
+    echo "  Kernel:    $kernel"
     echo "  Uptime:    $(uptime -p 2>/dev/null || echo 'N/A')"
-    echo "  Memory:    $(free -h 2>/dev/null | awk '/^Mem:/ {{print $3 "/" $2}}' || echo 'N/A')"
+    echo "  Memory:    $(awk '/^MemTotal:/ {{t=$2}} /^MemAvailable:/ {{a=$2}} END {{if (t) printf "%.1fGi/%.1fGi", (t-a)/1048576, t/1048576; else print "N/A"}}' /proc/meminfo 2>/dev/null || echo 'N/A')"
     echo ""{ssh_note_section}
     echo "====================================="
     echo ""
@@ -13,8 +13,8 @@ from typing import TYPE_CHECKING, Callable, Optional
 
 from gvm.modules.base import Dependency, Module, ModuleResult, ModuleStatus
 from gvm.utils.files import safe_write
-from gvm.utils.shell import run
-from gvm.utils.system import is_port_listening, is_service_running
+from gvm.utils.shell import apt_command, run, sudo_script
+from gvm.utils.system import is_port_listening, is_service_running, listening_ports
 
 if TYPE_CHECKING:
     from gvm.config import Config
@@ -98,10 +98,7 @@ class SSHModule(Module):
             # Step 2: Create SSH configuration file
             self._create_sshd_config(progress_callback)
 
-            # Step 3: Enable SSH service
-            self._enable_ssh_service(progress_callback)
-
-            # Step 4: Start/restart SSH service
+            # Step 3: Enable and restart SSH service
             self._restart_ssh_service(progress_callback)
 
             if self.dry_run:
@@ -155,7 +152,10 @@ class SSHModule(Module):
             return
 
         run(
-            ["sudo", "apt-get", "-y", "install", "openssh-server"],
+            apt_command(
+                "apt-get", "-y", "install", "openssh-server",
+                quiet=not self.verbose,
+            ),
             check=True,
             verbose=self.verbose,
         )
@@ -237,44 +237,13 @@ MaxAuthTries 3
             progress_callback, 0.5, "SSH configuration created"
         )
 
-    def _enable_ssh_service(
-        self,
-        progress_callback: Callable[[float, str, Optional[str]], None],
-    ) -> None:
-        """Enable SSH service to start on boot.
-
-        Args:
-            progress_callback: Callback to report progress.
-        """
-        self._report_progress(
-            progress_callback,
-            0.55,
-            "Enabling SSH service",
-            "Running systemctl enable ssh",
-        )
-
-        if self.dry_run:
-            print("[DRY RUN] Would run: sudo systemctl enable ssh")
-            self._report_progress(
-                progress_callback, 0.7, "SSH service enabled (dry run)"
-            )
-            return
-
-        run(
-            ["sudo", "systemctl", "enable", "ssh"],
-            check=True,
-            verbose=self.verbose,
-        )
-
-        self._report_progress(
-            progress_callback, 0.7, "SSH service enabled"
-        )
-
     def _restart_ssh_service(
         self,
         progress_callback: Callable[[float, str, Optional[str]], None],
     ) -> None:
-        """Restart SSH service and verify it's running.
+        """Enable SSH service on boot, restart it and verify it's running.
+
+        Both systemctl calls run under a single sudo invocation.
 
         Args:
             progress_callback: Callback to report progress.
@@ -283,12 +252,13 @@ MaxAuthTries 3
 
         self._report_progress(
             progress_callback,
-            0.75,
+            0.55,
             "Restarting SSH service",
-            "Running systemctl restart ssh",
+            "Running systemctl enable ssh && systemctl restart ssh",
         )
 
         if self.dry_run:
+            print("[DRY RUN] Would run: sudo systemctl enable ssh")
             print("[DRY RUN] Would run: sudo systemctl restart ssh")
             self._report_progress(
                 progress_callback, 1.0, "SSH service restarted (dry run)"
@@ -296,7 +266,10 @@ MaxAuthTries 3
             return
 
         run(
-            ["sudo", "systemctl", "restart", "ssh"],
+            sudo_script([
+                ["systemctl", "enable", "ssh"],
+                ["systemctl", "restart", "ssh"],
+            ]),
             check=True,
             verbose=self.verbose,
         )
@@ -324,16 +297,18 @@ MaxAuthTries 3
         )
 
         max_wait = 10  # seconds
-        port_listening = False
+        # Probe both ports with one ss call per poll
+        probe_ports = [forward_port, internal_port] if internal_port else [forward_port]
+        listening: set[int] = set()
         for _ in range(max_wait * 2):  # Check every 0.5 seconds
-            if is_port_listening(forward_port):
-                port_listening = True
+            listening = listening_ports(probe_ports)
+            if forward_port in listening:
                 break
             time.sleep(0.5)
 
-        if port_listening:
+        if forward_port in listening:
             print(f"SSH listening on port {forward_port}")
-            if internal_port and is_port_listening(internal_port):
+            if internal_port and internal_port in listening:
                 print(f"SSH also listening on port {internal_port}")
             print("")
             print("To connect from your computer:")
@@ -258,19 +258,13 @@ class UserModule(Module):
             if result.returncode != 0:
                 raise RuntimeError(f"Invalid sudoers syntax: {result.stderr}")
 
-            # Move to final location with correct ownership and permissions
+            # Copy to final location with ownership and permissions in one call
             run(
-                ["sudo", "cp", temp_path, str(self.sudoers_path)],
-                check=True,
-                verbose=self.verbose,
-            )
-            run(
-                ["sudo", "chmod", "440", str(self.sudoers_path)],
-                check=True,
-                verbose=self.verbose,
-            )
-            run(
-                ["sudo", "chown", "root:root", str(self.sudoers_path)],
+                [
+                    "sudo", "install",
+                    "-o", "root", "-g", "root", "-m", "440",
+                    temp_path, str(self.sudoers_path),
+                ],
                 check=True,
                 verbose=self.verbose,
             )
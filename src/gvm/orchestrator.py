@@ -461,13 +461,9 @@ class ModuleOrchestrator:
                     continue
 
             # Step 4.2: Check required dependencies succeeded
+            # Optional dependencies don't block execution
             failed_required_deps: list[str] = []
-            for dep in module.dependencies:
-                if not dep.required:
-                    # Optional dependencies don't block execution
-                    continue
-
-                dep_name = normalize_module_name(dep.module_name)
+            for dep_name in sorted(module.required_dependency_names):
                 dep_result = context.results.get(dep_name)
 
                 if dep_result is None:
@@ -526,7 +522,11 @@ class ModuleOrchestrator:
                                 False,
                             )
 
-                    result = module.run(module_progress)
+                    # Without a listener, modules get None and skip
+                    # progress reporting entirely in _report_progress
+                    result = module.run(
+                        module_progress if throttled_callback is not None else None
+                    )
                     context.results[module_name] = result
 
                     if result.status == ModuleStatus.SUCCESS:
@@ -703,6 +703,8 @@ class ModuleOrchestrator:
         invalid_names: list[str] = []
 
         for name in module_names:
+            # Same lookup as load_modules(), so modules registered at
+            # runtime validate too
             normalized_name = normalize_module_name(name)
             if get_module_class(normalized_name) is None:
                 invalid_names.append(name)
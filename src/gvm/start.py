@@ -13,6 +13,11 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from gvm.config import USER_CONFIG_DIR
+
+# Name of the desktop started last, used as the default for 'gvm start'
+_LAST_DESKTOP_FILE = USER_CONFIG_DIR / "last-desktop"
+
 if TYPE_CHECKING:
     from gvm.config import Config
 
@@ -171,7 +176,7 @@ def get_default_desktop(config: Config) -> Optional[str]:
     """Get default desktop to start.
 
     Priority:
-    1. Last used desktop (from ~/.config/gvm/last-desktop)
+    1. Last used desktop (from last-desktop in the gvm config directory)
     2. Only installed desktop (if exactly one)
     3. None (user must specify)
 
@@ -181,7 +186,7 @@ def get_default_desktop(config: Config) -> Optional[str]:
     Returns:
         Desktop name or None.
     """
-    last_desktop_file = Path.home() / ".config" / "gvm" / "last-desktop"
+    last_desktop_file = _LAST_DESKTOP_FILE
 
     # Check last used
     if last_desktop_file.exists():
@@ -214,7 +219,7 @@ def save_last_desktop(desktop_name: str) -> None:
         as this is just a convenience feature.
     """
     try:
-        last_desktop_file = Path.home() / ".config" / "gvm" / "last-desktop"
+        last_desktop_file = _LAST_DESKTOP_FILE
         last_desktop_file.parent.mkdir(parents=True, exist_ok=True)
         last_desktop_file.write_text(desktop_name + "\n")
     except OSError as e:
@@ -233,15 +238,14 @@ def launch_desktop(config: Config, desktop_name: str, verbose: bool = False) ->
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    desktops = config.discover_desktops()
+    desktop = config.get_desktop(desktop_name)
 
-    if desktop_name not in desktops:
+    if desktop is None:
         print(f"Error: Desktop '{desktop_name}' not found")
-        available = ", ".join(sorted(desktops.keys()))
+        available = ", ".join(sorted(config.discover_desktops().keys()))
         print(f"Available desktops: {available}")
         return 1
 
-    desktop = desktops[desktop_name]
     display_name = desktop.display_name or desktop_name
 
     # Check if desktop is installed
@@ -372,8 +376,8 @@ def cmd_start(
             return 1
 
         if verbose:
-            desktops = config.discover_desktops()
-            display = desktops[desktop_name].display_name if desktop_name in desktops else desktop_name
+            desktop = config.get_desktop(desktop_name)
+            display = desktop.display_name if desktop is not None else desktop_name
             print(f"Starting default desktop: {display} ({desktop_name})")
     else:
         # Resolve user input to canonical desktop name
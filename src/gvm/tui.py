@@ -20,6 +20,7 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional
 
+from gvm.config import USER_CONFIG_DIR
 from gvm.modules import ModuleResult, ModuleStatus, RecoveryAction, list_modules
 from gvm.orchestrator import ModuleOrchestrator
 
@@ -117,7 +118,7 @@ class CursesTUI:
     """
 
     # Selection persistence file path
-    SELECTION_FILE = Path.home() / ".config" / "gvm" / "last-selection.json"
+    SELECTION_FILE = USER_CONFIG_DIR / "last-selection.json"
 
     # Maximum log buffer size
     MAX_LOG_LINES = 1000
@@ -1,11 +1,12 @@
 """Utility functions for GVM tool."""
 
 from .shell import run
-from .files import ensure_snippet, safe_write
+from .files import ensure_snippet, requires_sudo, safe_write, safe_write_many
 from .system import (
     detect_debian_codename,
     is_service_running,
     is_port_listening,
+    listening_ports,
     get_user_home,
     user_exists,
     get_display_server,
@@ -18,7 +19,10 @@ __all__ = [
     "get_user_home",
     "is_port_listening",
     "is_service_running",
+    "listening_ports",
+    "requires_sudo",
     "run",
     "safe_write",
+    "safe_write_many",
     "user_exists",
 ]
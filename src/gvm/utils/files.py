@@ -8,11 +8,53 @@ This module provides functions for:
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
 import subprocess
 import tempfile
 from pathlib import Path
 
+from gvm.utils.shell import sudo_script
+
+# Read size used when scanning files for snippet markers
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+# (path, label) pairs known to contain a complete snippet in this process
+_installed_snippets: set[tuple[str, str]] = set()
+
+
+def _scan_for_markers(file_path: Path, begin: bytes, end: bytes) -> tuple[bool, bool]:
+    """Scan a file in chunks for the begin and end snippet markers.
+
+    Stops reading as soon as both markers have been seen, so the common
+    "already installed" case does not load the whole file.
+
+    Args:
+        file_path: File to scan.
+        begin: Encoded begin marker.
+        end: Encoded end marker.
+
+    Returns:
+        Tuple of (has_begin, has_end).
+    """
+    has_begin = has_end = False
+    # Keep enough of the previous chunk to match markers split across reads
+    overlap = max(len(begin), len(end)) - 1
+    tail = b""
+
+    with open(file_path, "rb") as f:
+        while not (has_begin and has_end):
+            chunk = f.read(_SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            window = tail + chunk
+            has_begin = has_begin or window.find(begin) != -1
+            has_end = has_end or window.find(end) != -1
+            tail = window[-overlap:] if overlap else b""
+
+    return has_begin, has_end
+
 
 def ensure_snippet(
     file_path: Path,
@@ -26,14 +68,16 @@ def ensure_snippet(
     - Marker end: # <<< {label} <<<
 
     If markers already exist in the file, the function returns without
-    modification. Otherwise, the snippet is appended to the file.
+    modification. Otherwise, the snippet is appended to the file. Files are
+    scanned in chunks so the check stops as soon as both markers are found,
+    and snippets seen in this process are remembered to skip repeat scans.
 
     Note:
         This function uses standard file I/O (open with append mode) and does
         NOT handle elevated permissions. It is intended for user-writable files
         only (e.g., ~/.bashrc, ~/.profile). For system files requiring root
         access (e.g., /etc/ssh/sshd_config), use safe_write() instead, which
-        supports sudo elevation via a temporary file and move pattern.
+        supports sudo elevation via install(1).
 
     Args:
         file_path: Path to the file to modify. Must be writable by current user.
@@ -50,29 +94,40 @@ def ensure_snippet(
         ...     "export PATH=$PATH:/opt/gvm/bin"
         ... )
     """
+    key = (str(file_path), label)
+    if key in _installed_snippets:
+        print(f"Snippet '{label}' already exists in {file_path}")
+        return
+
     # Create parent directories if they don't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Read existing content
-    if file_path.exists():
-        content = file_path.read_text()
-    else:
-        content = ""
-
     # Define markers
     marker_begin = f"# >>> {label} >>>"
     marker_end = f"# <<< {label} <<<"
 
-    has_begin = marker_begin in content
-    has_end = marker_end in content
+    # Check for existing markers without reading the whole file
+    try:
+        size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        size = 0
+
+    if size:
+        has_begin, has_end = _scan_for_markers(
+            file_path, marker_begin.encode(), marker_end.encode()
+        )
+    else:
+        has_begin = has_end = False
 
     # Check if markers already present (complete block)
     if has_begin and has_end:
+        _installed_snippets.add(key)
         print(f"Snippet '{label}' already exists in {file_path}")
         return
 
     # Handle partial marker state (corrupted/incomplete block)
     if has_begin or has_end:
+        content = file_path.read_text()
         if has_begin and not has_end:
             print(f"Warning: Found partial snippet '{label}' in {file_path} (begin marker without end marker)")
             print("  Removing partial block and re-adding complete snippet")
@@ -105,25 +160,57 @@ def ensure_snippet(
     with open(file_path, "a") as f:
         f.write(block)
 
+    _installed_snippets.add(key)
     print(f"Added snippet '{label}' to {file_path}")
 
 
+def _file_matches(path: Path, content: str, mode: int) -> bool:
+    """Check whether a file already holds exactly this content and mode.
+
+    Args:
+        path: File to compare.
+        content: Expected content.
+        mode: Expected permission bits.
+
+    Returns:
+        True if the file exists with identical bytes and permissions, False
+        otherwise (including when it cannot be read).
+    """
+    data = content.encode()
+    try:
+        st = path.stat()
+        if stat.S_IMODE(st.st_mode) != mode or st.st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
 def safe_write(
     path: Path,
     content: str,
     backup: bool = True,
     mode: int = 0o644,
-) -> None:
+    skip_if_unchanged: bool = True,
+) -> bool:
     """Safely write content to a file with optional backup.
 
-    For system files (outside user's home), uses sudo to copy the file.
-    Creates a backup with .bak suffix if requested.
+    For system files (outside user's home), pipes the content to
+    ``sudo install`` so the write costs a single privileged subprocess.
+    Creates a backup with .bak suffix if requested. When the file already
+    has the same content and mode, nothing is written or backed up, which
+    also avoids sudo on idempotent re-runs.
 
     Args:
         path: Target file path.
         content: Content to write.
         backup: If True, create backup of existing file.
         mode: File permission mode (default 0o644).
+        skip_if_unchanged: If True, return early when the file already
+            matches content and mode.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
 
     Raises:
         SystemExit: If file operations fail.
@@ -135,14 +222,10 @@ def safe_write(
         ...     backup=True
         ... )
     """
-    # Determine if we need sudo (system files outside home)
-    # Use Path.relative_to() to properly check path containment
-    home = Path.home()
-    try:
-        path.relative_to(home)
-        needs_sudo = False
-    except ValueError:
-        needs_sudo = True
+    if skip_if_unchanged and _file_matches(path, content, mode):
+        return False
+
+    needs_sudo = requires_sudo(path)
 
     # Create backup if requested and file exists
     if backup and path.exists():
@@ -153,30 +236,31 @@ def safe_write(
             shutil.copy2(path, backup_path)
         print(f"Created backup: {backup_path}")
 
+    if needs_sudo:
+        # Stream content straight into install(1) under a single sudo call;
+        # -D creates missing parent directories and -m applies the mode
+        try:
+            _sudo_write(path, content, mode)
+        except Exception as e:
+            raise SystemExit(f"Failed to write {path}: {e}") from e
+        print(f"Written: {path}")
+        return True
+
     # Write to temporary file first
     with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".tmp") as tmp:
         tmp.write(content)
         tmp_path = Path(tmp.name)
 
     try:
-        if needs_sudo:
-            # Ensure parent directory exists
-            parent = path.parent
-            if not parent.exists():
-                _sudo_mkdir(parent)
-
-            # Copy temp file to target with sudo
-            _sudo_copy(tmp_path, path)
-            _sudo_chmod(path, mode)
-        else:
-            # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Move temp file to target
-            shutil.move(tmp_path, path)
-            path.chmod(mode)
+        # Move temp file to target
+        shutil.move(tmp_path, path)
+        path.chmod(mode)
 
         print(f"Written: {path}")
+        return True
 
     except Exception as e:
         raise SystemExit(f"Failed to write {path}: {e}") from e
@@ -187,58 +271,130 @@ def safe_write(
             tmp_path.unlink()
 
 
-def _sudo_copy(src: Path, dst: Path) -> None:
-    """Copy a file using sudo.
+def requires_sudo(path: Path) -> bool:
+    """Check whether writing a path needs elevated permissions.
+
+    Paths inside the user's home directory are written directly; anything
+    else is treated as a system file.
 
     Args:
-        src: Source file path.
-        dst: Destination file path.
+        path: Target file path.
+
+    Returns:
+        True if the path is outside the user's home directory.
+    """
+    # Use Path.relative_to() to properly check path containment
+    try:
+        path.relative_to(Path.home())
+        return False
+    except ValueError:
+        return True
+
+
+def safe_write_many(
+    files: list[tuple[Path, str, int]],
+    backup: bool = True,
+) -> None:
+    """Write several files, batching all system files under one sudo call.
+
+    Files inside the user's home are written with safe_write(). System
+    files are staged in a temporary directory and then backed up and
+    copied into place with ``install -D`` by one ``sudo sh`` process.
+    Files that already match are skipped, as in safe_write().
+
+    Args:
+        files: List of (path, content, mode) tuples.
+        backup: If True, create a .bak backup of each existing file.
 
     Raises:
-        SystemExit: If copy fails.
+        SystemExit: If any write fails.
+
+    Example:
+        >>> safe_write_many([
+        ...     (Path("/etc/profile.d/a.sh"), "export A=1\\n", 0o644),
+        ...     (Path("/etc/profile.d/b.sh"), "export B=1\\n", 0o644),
+        ... ])
     """
-    result = subprocess.run(
-        ["sudo", "cp", str(src), str(dst)],
-        capture_output=True,
-        text=True,
-    )
+    system_files: list[tuple[Path, str, int]] = []
+    for path, content, mode in files:
+        if requires_sudo(path):
+            # Leave files that are already up to date out of the sudo batch
+            if not _file_matches(path, content, mode):
+                system_files.append((path, content, mode))
+        else:
+            safe_write(path, content, backup=backup, mode=mode)
+
+    if not system_files:
+        return
+
+    # Stage the contents as user-owned files, then back up and install
+    # every target from a single sudo shell
+    commands: list[list[str]] = []
+    backups: list[Path] = []
+    with tempfile.TemporaryDirectory() as staging:
+        for index, (path, content, mode) in enumerate(system_files):
+            staged = Path(staging) / str(index)
+            staged.write_text(content)
+            if backup and path.exists():
+                backup_path = path.with_suffix(path.suffix + ".bak")
+                commands.append(["cp", "-p", str(path), str(backup_path)])
+                backups.append(backup_path)
+            commands.append(
+                ["install", "-D", "-m", f"{mode:o}", str(staged), str(path)]
+            )
+
+        result = subprocess.run(
+            sudo_script(commands),
+            capture_output=True,
+            text=True,
+        )
     if result.returncode != 0:
-        raise SystemExit(f"sudo cp failed: {result.stderr}")
+        raise SystemExit(f"Failed to write system files: {result.stderr}")
+
+    for backup_path in backups:
+        print(f"Created backup: {backup_path}")
+    for path, _, _ in system_files:
+        print(f"Written: {path}")
+
 
+def _sudo_write(path: Path, content: str, mode: int) -> None:
+    """Write content to a file using a single sudo install(1) call.
 
-def _sudo_mkdir(path: Path) -> None:
-    """Create a directory using sudo.
+    Content is piped through stdin, so no temporary file is needed on the
+    Python side.
 
     Args:
-        path: Directory path to create.
+        path: Destination file path.
+        content: Content to write.
+        mode: Permission mode (e.g., 0o644).
 
     Raises:
-        SystemExit: If mkdir fails.
+        SystemExit: If install fails.
     """
     result = subprocess.run(
-        ["sudo", "mkdir", "-p", str(path)],
+        ["sudo", "install", "-D", "-m", f"{mode:o}", "/dev/stdin", str(path)],
+        input=content,
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
-        raise SystemExit(f"sudo mkdir failed: {result.stderr}")
+        raise SystemExit(f"sudo install failed: {result.stderr}")
 
 
-def _sudo_chmod(path: Path, mode: int) -> None:
-    """Change file permissions using sudo.
+def _sudo_copy(src: Path, dst: Path) -> None:
+    """Copy a file using sudo.
 
     Args:
-        path: File path.
-        mode: Permission mode (e.g., 0o644).
+        src: Source file path.
+        dst: Destination file path.
 
     Raises:
-        SystemExit: If chmod fails.
+        SystemExit: If copy fails.
     """
-    mode_str = oct(mode)[2:]  # Convert 0o644 to "644"
     result = subprocess.run(
-        ["sudo", "chmod", mode_str, str(path)],
+        ["sudo", "cp", str(src), str(dst)],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
-        raise SystemExit(f"sudo chmod failed: {result.stderr}")
+        raise SystemExit(f"sudo cp failed: {result.stderr}")
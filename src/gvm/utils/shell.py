@@ -5,14 +5,110 @@ This module provides functions for executing shell commands with:
 - Verbose mode for debugging
 - Progress callback support for streaming output
 - Proper error handling with clear messages
+- Building non-interactive APT command lines
+- Combining several privileged commands under one sudo call
 """
 
 from __future__ import annotations
 
+import codecs
+import io
 import os
+import shlex
 import subprocess
 from typing import Callable, Optional
 
+# Environment that keeps dpkg/debconf from prompting or probing the terminal.
+# Passed through env(1) because sudo resets the caller's environment.
+_APT_ENV = (
+    "DEBIAN_FRONTEND=noninteractive",
+    "APT_LISTCHANGES_FRONTEND=none",
+    "NEEDRESTART_MODE=a",
+)
+
+# Bytes requested per read when streaming command output; a chatty command
+# then costs one read per chunk rather than one per line
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Options that stop apt/dpkg from drawing progress bars on a pty
+_APT_QUIET_OPTIONS = (
+    "-qq",
+    "-o", "Dpkg::Use-Pty=0",
+    "-o", "Dpkg::Progress-Fancy=0",
+)
+
+# dpkg options that keep locally modified conffiles (and take the package
+# default for untouched ones) instead of stopping at an interactive prompt,
+# which DEBIAN_FRONTEND=noninteractive alone does not prevent. Pass them
+# to apt_command() for any command that can install or upgrade packages
+DPKG_CONFFILE_OPTIONS = (
+    "-o", "Dpkg::Options::=--force-confdef",
+    "-o", "Dpkg::Options::=--force-confold",
+)
+
+
+def apt_command(
+    tool: str,
+    *args: str,
+    quiet: bool = True,
+    sudo: bool = True,
+) -> list[str]:
+    """Build a sudo APT command line that runs non-interactively.
+
+    Scrolling per-file progress through a slow terminal emulator can
+    dominate install time, so by default apt and dpkg are told not to
+    render progress at all. Errors are still printed.
+
+    Args:
+        tool: APT binary to run (e.g., "apt-get").
+        *args: Arguments for the APT binary.
+        quiet: If True, suppress progress output. Pass False when the
+            user asked for verbose output.
+        sudo: If False, leave out the leading sudo, e.g. when the command
+            is passed to sudo_script().
+
+    Returns:
+        Command as a list of strings, suitable for run().
+
+    Example:
+        >>> run(apt_command("apt-get", "-y", "install", "curl"))
+    """
+    cmd = ["env", *_APT_ENV, tool]
+    if sudo:
+        cmd.insert(0, "sudo")
+    if quiet:
+        cmd.extend(_APT_QUIET_OPTIONS)
+    cmd.extend(args)
+    return cmd
+
+
+def sudo_script(
+    commands: list[list[str]],
+    stop_on_error: bool = True,
+) -> list[str]:
+    """Build a single sudo command that runs several commands in sequence.
+
+    Each command is shell-quoted and chained with ``&&``, so execution
+    stops at the first failure and sudo is only spawned once.
+
+    Args:
+        commands: Commands to run, each as a list of strings.
+        stop_on_error: If False, chain with ``;`` instead so every command
+            runs; the exit status is then that of the last command.
+
+    Returns:
+        Command as a list of strings, suitable for run().
+
+    Example:
+        >>> run(sudo_script([
+        ...     ["systemctl", "enable", "ssh"],
+        ...     ["systemctl", "restart", "ssh"],
+        ... ]))
+    """
+    separator = " && " if stop_on_error else "; "
+    script = separator.join(shlex.join(command) for command in commands)
+    return ["sudo", "sh", "-c", script]
+
 
 def run(
     cmd: list[str],
@@ -74,6 +170,9 @@ def run(
         merged_env.update(env)
         kwargs["env"] = merged_env
 
+    # Only I/O and env arguments are ever passed here. Leaving preexec_fn,
+    # start_new_session, pass_fds and friends at their defaults lets CPython
+    # start the child with vfork/posix_spawn instead of a full fork
     try:
         result = subprocess.run(cmd, **kwargs)
     except FileNotFoundError:
@@ -115,8 +214,7 @@ def _run_with_streaming(
     kwargs: dict = {
         "stdout": subprocess.PIPE,
         "stderr": subprocess.STDOUT,
-        "text": True,
-        "bufsize": 1,  # Line buffered
+        "bufsize": 0,  # Read straight from the pipe below
     }
 
     if env:
@@ -127,13 +225,28 @@ def _run_with_streaming(
 
     output_lines: list[str] = []
 
+    # Like run(), avoid Popen arguments that force the fork() path
     try:
         with subprocess.Popen(cmd, **kwargs) as proc:
             if proc.stdout:
-                for line in proc.stdout:
-                    line = line.rstrip("\n")
-                    output_lines.append(line)
-                    progress_callback(line)
+                # Decode like text mode would, translating \r\n and \r even
+                # when they straddle two reads, and split lines ourselves
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder("utf-8")(errors="replace"),
+                    translate=True,
+                )
+                fd = proc.stdout.fileno()
+                pending = ""
+                while chunk := os.read(fd, _STREAM_CHUNK_SIZE):
+                    *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+                    for line in lines:
+                        output_lines.append(line)
+                        progress_callback(line)
+
+                pending += decoder.decode(b"", final=True)
+                if pending:
+                    output_lines.append(pending)
+                    progress_callback(pending)
 
             proc.wait()
             returncode = proc.returncode
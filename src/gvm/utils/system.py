@@ -8,17 +8,30 @@ This module provides functions for:
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+# Matches VERSION_CODENAME=<codename> (may be quoted or unquoted).
+# Supports codenames with hyphens, dots, underscores (e.g., "bullseye-backports").
+_CODENAME_RE = re.compile(r'VERSION_CODENAME="?([A-Za-z0-9._-]+)"?')
 
+# POSIX portable username: starts with letter or underscore, followed by
+# alphanumerics, underscores, or hyphens, optionally ending with $ (for
+# system accounts).
+_USERNAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*\$?$")
+
+
+@functools.lru_cache(maxsize=1)
 def detect_debian_codename() -> Optional[str]:
     """Detect the Debian version codename from /etc/os-release.
 
-    Parses the VERSION_CODENAME field from the os-release file.
+    Parses the VERSION_CODENAME field from the os-release file. The result
+    is cached for the lifetime of the process since os-release does not
+    change while the tool is running.
 
     Returns:
         The Debian codename (e.g., "trixie", "bookworm") or None if not found.
@@ -28,19 +41,13 @@ def detect_debian_codename() -> Optional[str]:
         >>> print(codename)
         trixie
     """
-    os_release_path = Path("/etc/os-release")
-
-    if not os_release_path.exists():
-        return None
-
+    # A missing file surfaces as OSError, so no separate exists() probe
     try:
-        content = os_release_path.read_text()
-    except (IOError, PermissionError):
+        content = Path("/etc/os-release").read_text()
+    except OSError:
         return None
 
-    # Look for VERSION_CODENAME=<codename> (may be quoted or unquoted)
-    # Support codenames with hyphens, dots, underscores (e.g., "bullseye-backports")
-    match = re.search(r'VERSION_CODENAME="?([A-Za-z0-9._-]+)"?', content)
+    match = _CODENAME_RE.search(content)
     if match:
         return match.group(1)
 
@@ -98,6 +105,33 @@ def is_port_listening(port: int, timeout: int = DEFAULT_PROBE_TIMEOUT) -> bool:
         >>> if is_port_listening(22):
         ...     print("SSH port is open")
     """
+    return port in listening_ports([port], timeout=timeout)
+
+
+def listening_ports(
+    ports: Iterable[int], timeout: int = DEFAULT_PROBE_TIMEOUT
+) -> set[int]:
+    """Return which of the given TCP ports are listening.
+
+    Runs ss once and filters its output in Python, so checking several
+    ports costs a single process spawn.
+
+    Args:
+        ports: TCP port numbers to check.
+        timeout: Maximum seconds to wait for ss command (default: 5).
+
+    Returns:
+        Set of the requested ports that have a listening socket. Empty if
+        ss is unavailable or fails.
+
+    Example:
+        >>> listening_ports([22, 2222])
+        {2222}
+    """
+    wanted = {int(port) for port in ports}
+    if not wanted:
+        return set()
+
     # Use safe PATH to prevent PATH hijacking (includes /usr/sbin and /sbin for ss)
     safe_env = {"PATH": "/usr/sbin:/usr/bin:/sbin:/bin"}
     try:
@@ -109,20 +143,19 @@ def is_port_listening(port: int, timeout: int = DEFAULT_PROBE_TIMEOUT) -> bool:
             timeout=timeout,
             env=safe_env,
         )
+    except (FileNotFoundError, PermissionError, subprocess.TimeoutExpired):
+        return set()
 
-        if ss_result.returncode != 0:
-            return False
-
-        # Check if the port appears in the output
-        # ss output format includes ":port" in the local address column
-        # Use negative lookbehind to ensure the colon is not preceded by a digit
-        # (avoiding matching :122 when searching for :22)
-        # and lookahead for whitespace or end of string
-        port_pattern = rf"(?<![0-9]):{port}(?=\s|$)"
-        return bool(re.search(port_pattern, ss_result.stdout))
+    if ss_result.returncode != 0:
+        return set()
 
-    except (FileNotFoundError, PermissionError, subprocess.TimeoutExpired):
-        return False
+    # ss output format includes ":port" in the local address column, after
+    # an address that usually ends in a digit (0.0.0.0:22). Anchoring on the
+    # colon keeps :122 from matching when searching for :22, and the
+    # lookahead requires whitespace or end of string after the port.
+    alternatives = "|".join(str(port) for port in sorted(wanted))
+    port_pattern = re.compile(rf":({alternatives})(?=\s|$)", re.MULTILINE)
+    return {int(match) for match in port_pattern.findall(ss_result.stdout)}
 
 
 def get_user_home(username: str, timeout: int = DEFAULT_PROBE_TIMEOUT) -> Optional[Path]:
@@ -141,9 +174,7 @@ def get_user_home(username: str, timeout: int = DEFAULT_PROBE_TIMEOUT) -> Option
         /home/droid
     """
     # Validate username against POSIX portable filename character set
-    # Pattern: starts with letter or underscore, followed by alphanumerics, underscores,
-    # or hyphens, optionally ending with $ (for system accounts)
-    if not re.match(r"^[A-Za-z_][A-Za-z0-9_-]*\$?$", username):
+    if not _USERNAME_RE.match(username):
         return None
 
     # Use safe PATH to prevent PATH hijacking
@@ -190,9 +221,7 @@ def user_exists(username: str, timeout: int = DEFAULT_PROBE_TIMEOUT) -> bool:
         ...     print("User droid exists")
     """
     # Validate username against POSIX portable filename character set
-    # Pattern: starts with letter or underscore, followed by alphanumerics, underscores,
-    # or hyphens, optionally ending with $ (for system accounts)
-    if not re.match(r"^[A-Za-z_][A-Za-z0-9_-]*\$?$", username):
+    if not _USERNAME_RE.match(username):
         return False
 
     # Use safe PATH to prevent PATH hijacking
@@ -0,0 +1,249 @@
+"""Tests for APT module.
+
+This module validates:
+- is_installed() detection through the settings stamp
+- Settings digest sensitivity to the apt configuration
+- Stamp write failures not failing an otherwise successful run
+- dpkg audit fast path and repair
+- Cache cleanup as a single sudo shell
+
+Run with: python -m pytest tests/test_apt_module.py -v
+Or standalone: python tests/test_apt_module.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from gvm.config import Config
+from gvm.modules import ModuleStatus
+from gvm.modules import apt as apt_module
+from gvm.modules.apt import APTModule
+
+
+def _make_module(tmpdir: str, **apt_overrides) -> APTModule:
+    """Create an APTModule whose config and stamp live in tmpdir."""
+    config = Config.load()
+    if apt_overrides:
+        config = Config.load(cli_overrides={"apt": {**config.apt, **apt_overrides}})
+    module = APTModule(config)
+    module.apt_conf_path = Path(tmpdir) / "99-linuxvm-robust"
+    module.stamp_path = Path(tmpdir) / "apt.stamp"
+    module.apt_conf_path.write_text(module._build_apt_conf())
+    return module
+
+
+class TestAPTModuleIsInstalled(unittest.TestCase):
+    """Test cases for the stamp-based is_installed() fence."""
+
+    def test_not_installed_without_apt_config(self) -> None:
+        """is_installed returns False when the APT drop-in is missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            module = _make_module(tmpdir)
+            module.apt_conf_path.unlink()
+
+            is_installed, _ = module.is_installed()
+
+        self.assertFalse(is_installed)
+
+    def test_installed_when_stamp_fresh(self) -> None:
+        """is_installed returns True for a matching, recent stamp."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            module = _make_module(tmpdir)
+            module.stamp_path.write_text(
+                f"{module._settings_digest()}\n{int(time.time())}\n"
+            )
+
+            is_installed, message = module.is_installed()
+
+        self.assertTrue(is_installed)
+        self.assertIn("recently", message)
+
+    def test_not_installed_when_digest_differs(self) -> None:
+        """is_installed returns False when the settings changed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            module = _make_module(tmpdir)
+            module.stamp_path.write_text(f"{'0' * 64}\n{int(time.time())}\n")
+
+            is_installed, message = module.is_installed()
+
+        self.assertFalse(is_installed)
+        self.assertIn("changed", message)
+
+    def test_not_installed_after_refresh_interval(self) -> None:
+        """is_installed returns False once refresh_interval has passed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            module = _make_module(tmpdir, refresh_interval=60)
+            stamped_at = int(time.time()) - 61
+            module.stamp_path.write_text(
+                f"{module._settings_digest()}\n{stamped_at}\n"
+            )
+
+            is_installed, message = module.is_installed()
+
+        self.assertFalse(is_installed)
+        self.assertIn("refresh due", message)
+
+    def test_not_installed_with_unreadable_stamp(self) -> None:
+        """is_installed returns False for a malformed stamp."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            module = _make_module(tmpdir)
+            module.stamp_path.write_text("garbage")
+
+            is_installed, _ = module.is_installed()
+
+        self.assertFalse(is_installed)
+
+
+class TestAPTModuleSettingsDigest(unittest.TestCase):
+    """Test cases for _settings_digest()."""
+
+    def test_digest_stable_for_same_settings(self) -> None:
+        """The digest is identical for identical settings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = _make_module(tmpdir)._settings_digest()
+            second = _make_module(tmpdir)._settings_digest()
+
+        self.assertEqual(first, second)
+
+    def test_digest_changes_with_apt_section(self) -> None:
+        """Changing any apt setting changes the digest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = _make_module(tmpdir)._settings_digest()
+            packages = _make_module(tmpdir, base_packages=["curl"])._settings_digest()
+            retries = _make_module(tmpdir, retries=3)._settings_digest()
+
+        self.assertNotEqual(base, packages)
+        self.assertNotEqual(base, retries)
+        self.assertNotEqual(packages, retries)
+
+
+class TestAPTModuleStampWrite(unittest.TestCase):
+    """Test cases for recording the stamp after a run."""
+
+    def test_stamp_write_failure_does_not_fail_run(self) -> None:
+        """A run that completed still succeeds if the stamp cannot be written."""
+        module = APTModule(Config.load())
+        steps = (
+            "_harden_apt",
+            "_stabilize_mirrors",
+            "_clean_apt",
+            "_repair_dpkg",
+            "_update_upgrade",
+            "_install_packages",
+            "_dpkg_needs_repair",
+        )
+
+        finished = MagicMock(returncode=0, stdout="")
+        with patch("gvm.modules.apt.run", return_value=finished):
+            with patch.multiple(APTModule, **{step: MagicMock() for step in steps}):
+                with patch.object(
+                    APTModule,
+                    "_write_stamp",
+                    side_effect=SystemExit("Failed to write /var/lib/gvm/apt.stamp"),
+                ):
+                    result = module.run(MagicMock())
+
+        self.assertEqual(result.status, ModuleStatus.SUCCESS)
+
+
+class TestAPTModuleDpkgRepair(unittest.TestCase):
+    """Test cases for the dpkg audit fast path and repair."""
+
+    def setUp(self) -> None:
+        """Reset the process-wide dpkg health flag around each test."""
+        apt_module._dpkg_healthy = False
+        self.addCleanup(setattr, apt_module, "_dpkg_healthy", False)
+
+    @patch("gvm.modules.apt.run")
+    def test_clean_audit_skips_repair(self, mock_run: MagicMock) -> None:
+        """An empty dpkg --audit means no repair commands run."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        module = APTModule(Config.load())
+
+        module._repair_dpkg(MagicMock())
+
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args[0][0], ["dpkg", "--audit"])
+        self.assertTrue(apt_module._dpkg_healthy)
+
+    @patch("gvm.modules.apt.run")
+    def test_healthy_flag_skips_audit(self, mock_run: MagicMock) -> None:
+        """Once dpkg was found healthy, later checks do not audit again."""
+        apt_module._dpkg_healthy = True
+        module = APTModule(Config.load())
+
+        self.assertFalse(module._dpkg_needs_repair())
+        mock_run.assert_not_called()
+
+    @patch("gvm.modules.apt.run")
+    def test_dirty_audit_runs_repair(self, mock_run: MagicMock) -> None:
+        """Audit output triggers dpkg --configure and apt-get -f install."""
+        mock_run.side_effect = [
+            MagicMock(
+                returncode=0,
+                stdout="The following packages are only half configured",
+            ),
+            MagicMock(returncode=0, stdout=""),
+        ]
+        module = APTModule(Config.load())
+
+        module._repair_dpkg(MagicMock())
+
+        self.assertEqual(mock_run.call_count, 2)
+        repair_cmd = mock_run.call_args_list[1][0][0]
+        self.assertEqual(repair_cmd[:3], ["sudo", "sh", "-c"])
+        self.assertIn("dpkg --configure -a", repair_cmd[3])
+        self.assertIn("apt-get", repair_cmd[3])
+        self.assertFalse(apt_module._dpkg_healthy)
+
+    @patch("gvm.modules.apt.run")
+    def test_failed_repair_is_audited_again(self, mock_run: MagicMock) -> None:
+        """A failed repair does not mark dpkg healthy for later checks."""
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stdout="broken"),
+            MagicMock(returncode=100, stdout=""),
+            MagicMock(returncode=1, stdout="still broken"),
+        ]
+        module = APTModule(Config.load())
+
+        module._repair_dpkg(MagicMock())
+
+        self.assertTrue(module._dpkg_needs_repair())
+        self.assertEqual(mock_run.call_count, 3)
+
+
+class TestAPTModuleCleanApt(unittest.TestCase):
+    """Test cases for APT cache and list cleanup."""
+
+    @patch("gvm.modules.apt.run")
+    def test_cleanup_runs_one_sudo_shell(self, mock_run: MagicMock) -> None:
+        """Cleanup is one sudo sh call that expands globs and keeps partial/."""
+        module = APTModule(Config.load())
+
+        module._clean_apt(MagicMock())
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[:3], ["sudo", "sh", "-c"])
+        self.assertIn("rm -rf /var/lib/apt/lists/*", cmd[3])
+        self.assertIn("mkdir -p /var/lib/apt/lists/partial", cmd[3])
+        self.assertIn("/var/cache/apt/archives/*.deb", cmd[3])
+
+    @patch("gvm.modules.apt.run")
+    def test_dry_run_runs_nothing(self, mock_run: MagicMock) -> None:
+        """Dry runs only print the cleanup command."""
+        module = APTModule(Config.load(), dry_run=True)
+
+        with patch("sys.stdout"):
+            module._clean_apt(MagicMock())
+
+        mock_run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
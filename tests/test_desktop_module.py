@@ -508,6 +508,38 @@ class TestDesktopModuleRun(unittest.TestCase):
         self.assertEqual(result.status, ModuleStatus.SUCCESS)
         self.assertIn("complete", result.message.lower())
 
+    @patch("gvm.modules.desktop.run")
+    @patch("gvm.modules.desktop.safe_write")
+    @patch.object(Config, "discover_desktops")
+    def test_multiple_desktops_installed_in_single_transaction(
+        self,
+        mock_discover: MagicMock,
+        _mock_safe_write: MagicMock,
+        mock_run: MagicMock,
+    ) -> None:
+        """Packages for all selected desktops are installed with one apt-get call."""
+        mock_discover.return_value = {
+            "one": DesktopConfig(name="one", packages_core=["shared-pkg", "one-pkg"]),
+            "two": DesktopConfig(name="two", packages_core=["shared-pkg", "two-pkg"]),
+        }
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+
+        config = Config.load()
+        config._selected_desktops = ["one", "two"]
+        module = DesktopModule(config)
+
+        result = module.run(MagicMock())
+
+        self.assertEqual(result.status, ModuleStatus.SUCCESS)
+        install_calls = [
+            call for call in mock_run.call_args_list
+            if "apt-get" in call[0][0]
+        ]
+        self.assertEqual(len(install_calls), 1)
+        cmd = install_calls[0][0][0]
+        self.assertEqual(cmd[-3:], ["shared-pkg", "one-pkg", "two-pkg"])
+        self.assertNotIn("--download-only", cmd)
+
     @patch("gvm.modules.desktop.run")
     @patch.object(Config, "discover_desktops")
     def test_run_failure_on_command_error(
@@ -0,0 +1,228 @@
+"""Tests for file utilities.
+
+This module validates:
+- safe_write() direct writes, unchanged-file skip and backups
+- safe_write() sudo path through install(1)
+- safe_write_many() batching system files into one sudo shell
+
+Run with: python -m pytest tests/test_files.py -v
+Or standalone: python tests/test_files.py
+"""
+
+from __future__ import annotations
+
+import shlex
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from gvm.utils.files import safe_write, safe_write_many
+
+
+def _script_commands(cmd: list[str]) -> list[list[str]]:
+    """Split a sudo_script() command line back into its commands."""
+    return [shlex.split(part) for part in cmd[3].split(" && ")]
+
+
+class TestSafeWrite(unittest.TestCase):
+    """Test cases for safe_write()."""
+
+    @patch("gvm.utils.files.requires_sudo", return_value=False)
+    def test_writes_file_with_mode(self, _mock_sudo: MagicMock) -> None:
+        """A user file is written directly with the requested mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "sub" / "file.sh"
+
+            with patch("builtins.print"):
+                written = safe_write(path, "echo hi\n", mode=0o755)
+
+            self.assertTrue(written)
+            self.assertEqual(path.read_text(), "echo hi\n")
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o755)
+
+    @patch("gvm.utils.files.requires_sudo", return_value=False)
+    def test_skips_unchanged_file(self, _mock_sudo: MagicMock) -> None:
+        """A file with identical content and mode is neither written nor backed up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.conf"
+            path.write_text("same\n")
+            path.chmod(0o644)
+
+            written = safe_write(path, "same\n", backup=True)
+
+            self.assertFalse(written)
+            self.assertFalse(path.with_suffix(".conf.bak").exists())
+
+    @patch("gvm.utils.files.requires_sudo", return_value=False)
+    def test_mode_change_is_not_skipped(self, _mock_sudo: MagicMock) -> None:
+        """A file with the same content but another mode is rewritten."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.sh"
+            path.write_text("same\n")
+            path.chmod(0o644)
+
+            with patch("builtins.print"):
+                written = safe_write(path, "same\n", backup=False, mode=0o755)
+
+            self.assertTrue(written)
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o755)
+
+    @patch("gvm.utils.files.requires_sudo", return_value=False)
+    def test_backup_created_for_changed_file(self, _mock_sudo: MagicMock) -> None:
+        """The previous content is kept in a .bak file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.conf"
+            path.write_text("old\n")
+
+            with patch("builtins.print"):
+                safe_write(path, "new\n", backup=True)
+
+            self.assertEqual(path.read_text(), "new\n")
+            self.assertEqual(path.with_suffix(".conf.bak").read_text(), "old\n")
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_system_file_uses_sudo_install(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """A system file is piped to one sudo install call."""
+        mock_run.return_value = MagicMock(returncode=0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "missing.conf"
+
+            with patch("builtins.print"):
+                written = safe_write(path, "content\n", mode=0o600)
+
+        self.assertTrue(written)
+        mock_run.assert_called_once()
+        self.assertEqual(
+            mock_run.call_args[0][0],
+            ["sudo", "install", "-D", "-m", "600", "/dev/stdin", str(path)],
+        )
+        self.assertEqual(mock_run.call_args[1]["input"], "content\n")
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_system_file_failure_raises(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """A failed sudo install surfaces as SystemExit."""
+        mock_run.return_value = MagicMock(returncode=1, stderr="denied")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "missing.conf"
+
+            with self.assertRaises(SystemExit) as ctx:
+                safe_write(path, "content\n")
+
+        self.assertIn("denied", str(ctx.exception))
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_unchanged_system_file_skips_sudo(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """An up-to-date system file does not spawn sudo at all."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.conf"
+            path.write_text("same\n")
+            path.chmod(0o644)
+
+            written = safe_write(path, "same\n")
+
+        self.assertFalse(written)
+        mock_run.assert_not_called()
+
+
+class TestSafeWriteMany(unittest.TestCase):
+    """Test cases for safe_write_many()."""
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_system_files_share_one_sudo_shell(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """All changed system files are installed from a single sudo sh call."""
+        staged: dict[str, str] = {}
+
+        def fake_run(cmd, **_kwargs):
+            # Staged files only exist while the batch is running
+            for command in _script_commands(cmd):
+                if command[0] == "install":
+                    staged[command[-1]] = Path(command[-2]).read_text()
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = fake_run
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "a.sh"
+            second = Path(tmpdir) / "b.sh"
+
+            with patch("builtins.print"):
+                safe_write_many(
+                    [(first, "export A=1\n", 0o644), (second, "export B=1\n", 0o755)]
+                )
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[:3], ["sudo", "sh", "-c"])
+        commands = _script_commands(cmd)
+        self.assertEqual(commands[0][:4], ["install", "-D", "-m", "644"])
+        self.assertEqual(commands[1][:4], ["install", "-D", "-m", "755"])
+        self.assertEqual(
+            staged, {str(first): "export A=1\n", str(second): "export B=1\n"}
+        )
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_unchanged_files_left_out_of_batch(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """Matching files are skipped, and an empty batch runs nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.sh"
+            path.write_text("export A=1\n")
+            path.chmod(0o644)
+
+            safe_write_many([(path, "export A=1\n", 0o644)])
+
+        mock_run.assert_not_called()
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_existing_files_backed_up_first(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """Existing system files are copied to .bak before being replaced."""
+        mock_run.return_value = MagicMock(returncode=0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.sh"
+            path.write_text("old\n")
+
+            with patch("builtins.print") as mock_print:
+                safe_write_many([(path, "new\n", 0o644)], backup=True)
+
+        commands = _script_commands(mock_run.call_args[0][0])
+        backup_path = str(path) + ".bak"
+        self.assertEqual(commands[0], ["cp", "-p", str(path), backup_path])
+        self.assertEqual(commands[1][0], "install")
+        mock_print.assert_any_call(f"Created backup: {backup_path}")
+
+    @patch("gvm.utils.files.subprocess.run")
+    @patch("gvm.utils.files.requires_sudo", return_value=True)
+    def test_batch_failure_raises(
+        self, _mock_sudo: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """A failed batch surfaces as SystemExit."""
+        mock_run.return_value = MagicMock(returncode=1, stderr="denied")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.sh"
+
+            with self.assertRaises(SystemExit) as ctx:
+                safe_write_many([(path, "export A=1\n", 0o644)])
+
+        self.assertIn("denied", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for GPU status detection.
+
+This module validates:
+- Render node driver detection through a fake sysfs tree
+- check_virgl_status() result caching, TTL expiry and force refresh
+
+Run with: python -m pytest tests/test_gpu.py -v
+Or standalone: python tests/test_gpu.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from gvm import gpu
+
+
+def _add_render_node(drm: Path, name: str, driver: str) -> None:
+    """Create a render node whose device uevent names the given driver."""
+    device = drm / name / "device"
+    device.mkdir(parents=True)
+    (device / "uevent").write_text(f"DRIVER={driver}\nPCI_CLASS=30000\n")
+
+
+class TestDetectRendererViaSysfs(unittest.TestCase):
+    """Test cases for _detect_renderer_via_sysfs()."""
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.drm = Path(tmpdir.name) / "drm"
+        patcher = patch("gvm.gpu._SYSFS_DRM", self.drm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_virtio_gpu_node_detected(self) -> None:
+        """A virtio_gpu render node means VirGL."""
+        _add_render_node(self.drm, "renderD128", "virtio_gpu")
+
+        self.assertIs(gpu._detect_renderer_via_sysfs(), True)
+
+    def test_virtio_gpu_found_among_other_nodes(self) -> None:
+        """Any virtio_gpu node is enough when several drivers are present."""
+        _add_render_node(self.drm, "renderD128", "i915")
+        _add_render_node(self.drm, "renderD129", "virtio_gpu")
+
+        self.assertIs(gpu._detect_renderer_via_sysfs(), True)
+
+    def test_no_render_nodes_means_software(self) -> None:
+        """An existing DRM class without render nodes means no GPU."""
+        (self.drm / "card0").mkdir(parents=True)
+
+        self.assertIs(gpu._detect_renderer_via_sysfs(), False)
+
+    def test_other_driver_is_inconclusive(self) -> None:
+        """A render node from another driver leaves the answer to glxinfo."""
+        _add_render_node(self.drm, "renderD128", "i915")
+
+        self.assertIsNone(gpu._detect_renderer_via_sysfs())
+
+    def test_unreadable_uevent_is_inconclusive(self) -> None:
+        """A render node without a readable uevent is skipped."""
+        (self.drm / "renderD128").mkdir(parents=True)
+
+        self.assertIsNone(gpu._detect_renderer_via_sysfs())
+
+    def test_missing_sysfs_is_inconclusive(self) -> None:
+        """Without /sys/class/drm nothing can be concluded."""
+        self.assertIsNone(gpu._detect_renderer_via_sysfs())
+
+
+class TestCheckVirglStatusCache(unittest.TestCase):
+    """Test cases for check_virgl_status() caching."""
+
+    def setUp(self) -> None:
+        gpu._virgl_status_cache = None
+        self.addCleanup(setattr, gpu, "_virgl_status_cache", None)
+        patcher = patch("gvm.gpu._probe_virgl_status")
+        self.mock_probe: MagicMock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_probe.side_effect = [(True, "first"), (False, "second")]
+
+    @patch("gvm.gpu.time.monotonic")
+    def test_result_reused_within_ttl(self, mock_time: MagicMock) -> None:
+        """A second check inside the TTL does not probe again."""
+        mock_time.side_effect = [100.0, 100.0 + gpu._VIRGL_STATUS_TTL - 0.1]
+
+        first = gpu.check_virgl_status()
+        second = gpu.check_virgl_status()
+
+        self.assertEqual(first, (True, "first"))
+        self.assertEqual(second, first)
+        self.mock_probe.assert_called_once()
+
+    @patch("gvm.gpu.time.monotonic")
+    def test_result_expires_after_ttl(self, mock_time: MagicMock) -> None:
+        """A check after the TTL probes again."""
+        mock_time.side_effect = [100.0, 100.0 + gpu._VIRGL_STATUS_TTL]
+
+        gpu.check_virgl_status()
+        second = gpu.check_virgl_status()
+
+        self.assertEqual(second, (False, "second"))
+        self.assertEqual(self.mock_probe.call_count, 2)
+
+    @patch("gvm.gpu.time.monotonic")
+    def test_force_bypasses_cache(self, mock_time: MagicMock) -> None:
+        """force=True probes again even inside the TTL."""
+        mock_time.side_effect = [100.0, 100.5]
+
+        gpu.check_virgl_status()
+        second = gpu.check_virgl_status(force=True)
+
+        self.assertEqual(second, (False, "second"))
+        self.assertEqual(self.mock_probe.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
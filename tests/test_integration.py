@@ -21,6 +21,7 @@ Or standalone: python tests/test_integration.py
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import tempfile
 import unittest
@@ -29,12 +30,14 @@ from typing import Optional
 from unittest import mock
 
 from gvm.cli import (
+    _sniff_subcommand,
     cmd_desktop,
     cmd_fix,
     cmd_info,
     cmd_module,
     cmd_setup,
     create_argument_parser,
+    main,
     route_command,
 )
 from gvm.config import Config, DesktopConfig, EMBEDDED_DEFAULTS
@@ -278,6 +281,32 @@ class TestIndividualModuleExecution(unittest.TestCase):
         self.assertTrue(args.dry_run)
         self.assertEqual(args.command, "apt")
 
+    def test_sniff_subcommand_skips_global_flags(self) -> None:
+        """Subcommand is found after global flags and the --config value."""
+        self.assertEqual(
+            _sniff_subcommand(["-v", "--config", "desktop", "apt", "-h"]), "apt"
+        )
+        self.assertIsNone(_sniff_subcommand(["--help"]))
+        self.assertIsNone(_sniff_subcommand(["bogus"]))
+
+    def test_cli_parser_for_single_subcommand(self) -> None:
+        """Parser built for one subcommand parses that command's arguments."""
+        parser = create_argument_parser("desktop")
+
+        args = parser.parse_args(["--dry-run", "desktop", "list"])
+        self.assertTrue(args.dry_run)
+        self.assertEqual(args.command, "desktop")
+        self.assertEqual(args.desktop_target, "list")
+
+    def test_main_help_skips_parser(self) -> None:
+        """Bare help requests are answered without building the parser."""
+        for argv in (["gvm"], ["gvm", "--help"], ["gvm", "apt", "-h"]):
+            with mock.patch("sys.argv", argv):
+                with mock.patch("gvm.cli.create_argument_parser") as mock_parser:
+                    with mock.patch("sys.stdout", new_callable=io.StringIO):
+                        self.assertEqual(main(), 0)
+            mock_parser.assert_not_called()
+
 
 class TestTUIComponentSelection(unittest.TestCase):
     """Test TUI component selection logic (mocked curses).
@@ -549,6 +578,49 @@ class TestConfigPriorityChain(unittest.TestCase):
         self.assertEqual(result["apt"], {"retries": 5})
         self.assertNotIn("timeout", result["apt"])
 
+    def test_load_toml_caches_until_file_changes(self) -> None:
+        """_load_toml reuses the parsed file until its contents change."""
+        from gvm.config import _load_toml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cached.toml"
+            path.write_text('[ports]\nssh_forward = 3000\n')
+
+            first = _load_toml(path)
+            with mock.patch("gvm.config.tomllib.load") as mock_load:
+                second = _load_toml(path)
+            mock_load.assert_not_called()
+            self.assertEqual(first, second)
+
+            path.write_text('[ports]\nssh_forward = 31000\n')
+            self.assertEqual(_load_toml(path)["ports"]["ssh_forward"], 31000)
+
+    def test_load_toml_returns_independent_copies(self) -> None:
+        """Mutating a loaded section does not leak into later loads."""
+        from gvm.config import _load_toml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cached.toml"
+            path.write_text('[apt]\nbase_packages = ["curl"]\n')
+
+            first = _load_toml(path)
+            first["apt"]["base_packages"].append("git")
+            first["apt"]["retries"] = 99
+
+            second = _load_toml(path)
+            self.assertEqual(second, {"apt": {"base_packages": ["curl"]}})
+
+    def test_load_toml_raises_config_error(self) -> None:
+        """_load_toml raises ConfigError instead of exiting on bad TOML."""
+        from gvm.config import ConfigError, _load_toml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "broken.toml"
+            path.write_text('[ports\nssh_forward = \n')
+
+            with self.assertRaises(ConfigError):
+                _load_toml(path)
+
 
 class TestConfigPriorityChainFull(unittest.TestCase):
     """Test full configuration priority chain: embedded < repo < user < CLI.
@@ -561,7 +633,6 @@ class TestConfigPriorityChainFull(unittest.TestCase):
     def test_repo_config_overrides_embedded_defaults(self) -> None:
         """Test that repo config overrides embedded defaults."""
         from gvm.config import _load_toml, _merge_configs, EMBEDDED_DEFAULTS
-        import copy
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create repo config with override
@@ -569,7 +640,7 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             repo_config_path.write_text('[ports]\nssh_forward = 3000\n')
 
             # Manually test the loading with simulated repo config
-            config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
+            config_data = dict(EMBEDDED_DEFAULTS)
 
             # Default should be 2222
             self.assertEqual(config_data["ports"]["ssh_forward"], 2222)
@@ -584,7 +655,6 @@ class TestConfigPriorityChainFull(unittest.TestCase):
     def test_user_config_overrides_repo_config(self) -> None:
         """Test that user config overrides repo config values."""
         from gvm.config import _load_toml, _merge_configs, EMBEDDED_DEFAULTS
-        import copy
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create repo config
@@ -596,7 +666,7 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             user_config_path.write_text('[ports]\nssh_forward = 4000\n')
 
             # Simulate priority chain: embedded -> repo -> user
-            config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
+            config_data = dict(EMBEDDED_DEFAULTS)
             self.assertEqual(config_data["ports"]["ssh_forward"], 2222)
 
             # Apply repo config
@@ -612,7 +682,6 @@ class TestConfigPriorityChainFull(unittest.TestCase):
     def test_cli_config_overrides_user_config(self) -> None:
         """Test that CLI config file overrides user config values."""
         from gvm.config import _load_toml, _merge_configs, EMBEDDED_DEFAULTS
-        import copy
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create user config
@@ -624,7 +693,7 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             cli_config_path.write_text('[ports]\nssh_forward = 5000\n')
 
             # Simulate priority chain: embedded -> user -> cli_config
-            config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
+            config_data = dict(EMBEDDED_DEFAULTS)
 
             user_config = _load_toml(user_config_path)
             config_data = _merge_configs(config_data, user_config)
@@ -637,7 +706,6 @@ class TestConfigPriorityChainFull(unittest.TestCase):
     def test_cli_overrides_override_cli_config(self) -> None:
         """Test that CLI flag overrides have highest priority over CLI config."""
         from gvm.config import _load_toml, _merge_configs, EMBEDDED_DEFAULTS
-        import copy
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create CLI config file
@@ -645,7 +713,7 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             cli_config_path.write_text('[ports]\nssh_forward = 5000\n')
 
             # Simulate full priority chain with CLI override
-            config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
+            config_data = dict(EMBEDDED_DEFAULTS)
 
             cli_config = _load_toml(cli_config_path)
             config_data = _merge_configs(config_data, cli_config)
@@ -659,7 +727,6 @@ class TestConfigPriorityChainFull(unittest.TestCase):
     def test_full_priority_chain_integration(self) -> None:
         """Test complete priority chain: embedded < repo < user < cli_config < cli_override."""
         from gvm.config import _load_toml, _merge_configs, EMBEDDED_DEFAULTS, Config
-        import copy
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create all config levels
@@ -673,7 +740,7 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             cli_path.write_text('[ports]\nssh_forward = 5000\n')
 
             # Simulate priority chain
-            config_data = copy.deepcopy(EMBEDDED_DEFAULTS)
+            config_data = dict(EMBEDDED_DEFAULTS)
 
             # 1. Embedded defaults
             self.assertEqual(config_data["ports"]["ssh_forward"], 2222)
@@ -698,28 +765,46 @@ class TestConfigPriorityChainFull(unittest.TestCase):
             config_data = _merge_configs(config_data, cli_overrides)
             self.assertEqual(config_data["ports"]["ssh_forward"], 6000)
 
-    @mock.patch("gvm.config.Path.home")
-    def test_config_load_with_patched_paths(
-        self, mock_home: mock.Mock
-    ) -> None:
-        """Test Config.load with patched home directory for user config."""
+    def test_config_load_with_patched_paths(self) -> None:
+        """Test Config.load with a patched XDG config directory for user config."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            # Set up mock home directory
-            mock_home.return_value = Path(tmpdir)
-
-            # Create user config in mock home
+            # Create user config in mock XDG config directory
             user_config_dir = Path(tmpdir) / ".config" / "gvm"
             user_config_dir.mkdir(parents=True, exist_ok=True)
             user_config_file = user_config_dir / "config.toml"
             user_config_file.write_text('[ports]\nssh_forward = 7777\n')
 
             # Load config - should pick up user config
-            config = Config.load()
+            with mock.patch("gvm.config.USER_CONFIG_PATH", user_config_file):
+                config = Config.load()
 
             # If user config was loaded, port should be 7777
             # (Note: This depends on repo config not existing or not overriding)
             self.assertEqual(config.ssh_forward_port, 7777)
 
+    def test_config_load_without_config_files(self) -> None:
+        """Config.load uses embedded defaults directly when no files exist."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = Path(tmpdir) / "missing"
+
+            with mock.patch("gvm.config.REPO_CONFIG_PATH", missing / "default.toml"):
+                with mock.patch("gvm.config.USER_CONFIG_PATH", missing / "config.toml"):
+                    with mock.patch("gvm.config._load_toml") as mock_load:
+                        config = Config.load()
+
+            mock_load.assert_not_called()
+            self.assertEqual(config.ssh_forward_port, 2222)
+            self.assertEqual(config.apt["retries"], EMBEDDED_DEFAULTS["apt"]["retries"])
+
+    def test_embedded_defaults_are_frozen(self) -> None:
+        """Embedded defaults are read-only; loaded sections are mutable copies."""
+        with self.assertRaises(TypeError):
+            EMBEDDED_DEFAULTS["apt"]["retries"] = 1
+
+        config = Config.from_dict(EMBEDDED_DEFAULTS)
+        self.assertIsInstance(config.apt, dict)
+        self.assertIsInstance(config.apt["mirrors"], list)
+
     def test_config_load_with_cli_config_path(self) -> None:
         """Test Config.load with explicit cli_config_path parameter."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -776,6 +861,29 @@ class TestDesktopDiscoveryAndListing(unittest.TestCase):
         # This depends on repo having config/packages/*.toml files
         self.assertIsInstance(desktops, dict)
 
+    def test_get_desktop_loads_single_file(self) -> None:
+        """get_desktop finds a desktop by file name without a full scan."""
+        config = Config.load()
+
+        with mock.patch.object(Config, "discover_desktops") as mock_discover:
+            desktop = config.get_desktop("xfce4")
+
+        mock_discover.assert_not_called()
+        self.assertIsNotNone(desktop)
+        self.assertEqual(desktop.name, "xfce4")
+
+    def test_desktop_configs_not_shared_between_loads(self) -> None:
+        """Changing one Config's desktop does not leak into another load."""
+        first = Config.load().get_desktop("xfce4")
+        first.packages_user.append("leaked-package")
+        first.files["/tmp/leaked"] = "leaked"
+
+        second = Config.load().get_desktop("xfce4")
+
+        self.assertIsNot(first, second)
+        self.assertNotIn("leaked-package", second.packages_user)
+        self.assertNotIn("/tmp/leaked", second.files)
+
     def test_desktop_list_command(self) -> None:
         """Desktop list command shows available desktops."""
         config = Config.load()
@@ -842,6 +950,10 @@ helper_script_name = "start-test"
             ["core1", "core2", "opt1", "wayland1", "user1"],
         )
 
+        # The result is a copy, so changing it leaves the desktop intact
+        all_packages.append("extra")
+        self.assertNotIn("extra", desktop_config.get_all_packages())
+
 
 class TestDryRunMode(unittest.TestCase):
     """Test dry-run mode propagates to all modules.
@@ -1101,8 +1213,8 @@ class TestCLIRouting(unittest.TestCase):
         )
 
         with mock.patch("builtins.print"):
-            with mock.patch("gvm.cli.is_service_running", return_value=False):
-                with mock.patch("gvm.cli.is_port_listening", return_value=False):
+            with mock.patch("gvm.utils.system.is_service_running", return_value=False):
+                with mock.patch("gvm.utils.system.is_port_listening", return_value=False):
                     result = route_command(args, self.config)
 
         self.assertEqual(result, 0)
@@ -1133,11 +1245,11 @@ class TestCLIRouting(unittest.TestCase):
             config=None,
         )
 
-        with mock.patch("builtins.print") as mock_print:
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
             result = route_command(args, self.config)
 
         self.assertEqual(result, 0)
-        mock_print.assert_called()
+        self.assertIn("USAGE:", mock_stdout.getvalue())
 
 
 class TestExecutionSummary(unittest.TestCase):
@@ -1212,6 +1324,33 @@ class TestModuleValidation(unittest.TestCase):
         self.assertTrue(all_valid)
         self.assertEqual(invalid, [])
 
+    def test_validate_modules_runtime_registered(self) -> None:
+        """Modules registered at runtime validate like built-in ones."""
+        class ExtraModule(Module):
+            name = "extra"
+            description = "Test extra"
+
+            def is_installed(self) -> tuple[bool, str]:
+                return (False, "")
+
+            def run(self, progress_callback) -> ModuleResult:
+                return ModuleResult(status=ModuleStatus.SUCCESS, message="")
+
+        from gvm.modules import AVAILABLE_MODULES
+
+        original_modules = AVAILABLE_MODULES.copy()
+        AVAILABLE_MODULES["extra"] = ExtraModule
+
+        try:
+            orchestrator = ModuleOrchestrator(Config.load())
+            all_valid, invalid = orchestrator.validate_modules(["extra"])
+        finally:
+            AVAILABLE_MODULES.clear()
+            AVAILABLE_MODULES.update(original_modules)
+
+        self.assertTrue(all_valid)
+        self.assertEqual(invalid, [])
+
 
 class TestSetupAllCLIFlow(unittest.TestCase):
     """Test setup --all CLI flow end-to-end via CLI routing.
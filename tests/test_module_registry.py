@@ -5,6 +5,7 @@ This module validates:
 - list_modules() output correctness
 - Abstract base class enforcement (Module cannot be instantiated directly)
 - Immutability of dependencies attribute across module classes
+- Coalescing of repeated progress updates
 
 Run with: python -m pytest tests/test_module_registry.py -v
 Or standalone: python tests/test_module_registry.py
@@ -13,7 +14,7 @@ Or standalone: python tests/test_module_registry.py
 from __future__ import annotations
 
 import unittest
-from typing import Sequence
+from typing import Optional, Sequence
 
 from gvm.config import Config
 from gvm.modules import (
@@ -166,6 +167,40 @@ class TestDependenciesImmutability(unittest.TestCase):
         # Verify base class dependencies unchanged
         self.assertEqual(len(Module.dependencies), 0)
 
+    def test_dependency_name_sets_derived_from_dependencies(self) -> None:
+        """Subclasses get normalized dependency name sets computed once."""
+
+        class ModuleC(Module):
+            name = "module_c"
+            description = "Test module C"
+            dependencies = (
+                Dependency("APT", required=True),
+                Dependency(" ssh ", required=False),
+            )
+
+            def is_installed(self) -> tuple[bool, str]:
+                return (False, "")
+
+            def run(self, _progress_callback) -> ModuleResult:
+                return ModuleResult(status=ModuleStatus.SUCCESS, message="")
+
+        self.assertEqual(ModuleC.dependency_names, frozenset({"apt", "ssh"}))
+        self.assertEqual(ModuleC.required_dependency_names, frozenset({"apt"}))
+        self.assertEqual(APTModule.dependency_names, frozenset())
+
+    def test_dependency_and_result_are_frozen(self) -> None:
+        """Dependency and ModuleResult are immutable and hashable."""
+        dep = Dependency("apt")
+        result = ModuleResult(status=ModuleStatus.SUCCESS, message="Done")
+
+        with self.assertRaises(AttributeError):
+            dep.required = False  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            result.message = "Changed"  # type: ignore[misc]
+
+        self.assertEqual(len({dep, Dependency("apt")}), 1)
+        self.assertEqual(hash(result), hash(ModuleResult(ModuleStatus.SUCCESS, "Done")))
+
     def test_dependencies_type_annotation(self) -> None:
         """Module.dependencies has Sequence type annotation."""
         # Access type hints from the class
@@ -204,5 +239,35 @@ class TestModuleInstantiation(unittest.TestCase):
         self.assertEqual(module.get_recovery_command(), "gvm fix apt")
 
 
+class TestReportProgress(unittest.TestCase):
+    """Test cases for progress reporting through the module base class."""
+
+    def test_repeated_updates_are_coalesced(self) -> None:
+        """Rapid repeats of one message are dropped, other updates pass."""
+        module = APTModule(Config.load())
+        calls: list[tuple[float, str]] = []
+
+        def callback(percent: float, message: str, operation: Optional[str]) -> None:
+            calls.append((percent, message))
+
+        module._report_progress(callback, 0.0, "Starting")
+        module._report_progress(callback, 0.5, "Working")
+        module._report_progress(callback, 0.501, "Working")
+        module._report_progress(callback, 0.6, "Working")
+        module._report_progress(callback, 0.6, "Almost done")
+        module._report_progress(callback, 1.0, "Almost done")
+
+        self.assertEqual(
+            calls,
+            [
+                (0.0, "Starting"),
+                (0.5, "Working"),
+                (0.6, "Working"),
+                (0.6, "Almost done"),
+                (1.0, "Almost done"),
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for shell command helpers.
+
+This module validates:
+- apt_command() argv shape with and without sudo and quiet options
+- sudo_script() chaining with && or ;
+- sudo_script() quoting of arguments containing spaces
+
+Run with: python -m pytest tests/test_shell_utils.py -v
+Or standalone: python tests/test_shell_utils.py
+"""
+
+from __future__ import annotations
+
+import shlex
+import unittest
+
+from gvm.utils.shell import (
+    DPKG_CONFFILE_OPTIONS,
+    _APT_ENV,
+    _APT_QUIET_OPTIONS,
+    apt_command,
+    sudo_script,
+)
+
+
+class TestAptCommand(unittest.TestCase):
+    """Test cases for apt_command()."""
+
+    def test_default_is_sudo_env_and_quiet(self) -> None:
+        """By default the command runs under sudo env with quiet options."""
+        cmd = apt_command("apt-get", "-y", "install", "curl")
+
+        self.assertEqual(
+            cmd,
+            [
+                "sudo", "env", *_APT_ENV, "apt-get",
+                *_APT_QUIET_OPTIONS, "-y", "install", "curl",
+            ],
+        )
+        self.assertIn("DEBIAN_FRONTEND=noninteractive", cmd)
+
+    def test_without_sudo(self) -> None:
+        """sudo=False starts the command with env."""
+        cmd = apt_command("apt-get", "update", sudo=False)
+
+        self.assertEqual(cmd[0], "env")
+        self.assertNotIn("sudo", cmd)
+
+    def test_not_quiet(self) -> None:
+        """quiet=False passes the arguments straight after the tool."""
+        cmd = apt_command("apt-get", "-y", "upgrade", quiet=False)
+
+        self.assertEqual(cmd, ["sudo", "env", *_APT_ENV, "apt-get", "-y", "upgrade"])
+
+    def test_conffile_options_pass_through(self) -> None:
+        """Conffile options keep their -o pairs in order."""
+        cmd = apt_command("apt-get", *DPKG_CONFFILE_OPTIONS, "-y", "install", "x")
+
+        start = cmd.index("Dpkg::Options::=--force-confdef") - 1
+        self.assertEqual(
+            tuple(cmd[start:start + len(DPKG_CONFFILE_OPTIONS)]),
+            DPKG_CONFFILE_OPTIONS,
+        )
+
+
+class TestSudoScript(unittest.TestCase):
+    """Test cases for sudo_script()."""
+
+    def test_commands_chained_with_and(self) -> None:
+        """Commands run under one sudo sh and stop at the first failure."""
+        cmd = sudo_script([
+            ["systemctl", "enable", "ssh"],
+            ["systemctl", "restart", "ssh"],
+        ])
+
+        self.assertEqual(
+            cmd,
+            ["sudo", "sh", "-c", "systemctl enable ssh && systemctl restart ssh"],
+        )
+
+    def test_commands_chained_with_semicolon(self) -> None:
+        """stop_on_error=False runs every command."""
+        cmd = sudo_script(
+            [["dpkg", "--configure", "-a"], ["apt-get", "-f", "install"]],
+            stop_on_error=False,
+        )
+
+        self.assertEqual(cmd[3], "dpkg --configure -a; apt-get -f install")
+
+    def test_arguments_are_quoted(self) -> None:
+        """Arguments with spaces or shell characters survive as one word."""
+        cmd = sudo_script([["cp", "/tmp/my file", "/etc/a;b"]])
+
+        self.assertEqual(shlex.split(cmd[3]), ["cp", "/tmp/my file", "/etc/a;b"])
+
+    def test_nested_apt_command(self) -> None:
+        """apt_command(sudo=False) output can be embedded in a script."""
+        cmd = sudo_script([apt_command("apt-get", "update", sudo=False)])
+
+        self.assertEqual(cmd[:3], ["sudo", "sh", "-c"])
+        self.assertEqual(
+            shlex.split(cmd[3]), apt_command("apt-get", "update", sudo=False)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
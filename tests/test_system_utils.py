@@ -0,0 +1,76 @@
+"""Tests for system probing helpers.
+
+This module validates:
+- listening_ports() parsing of ss output
+- listening_ports() handling of missing or failing ss
+
+Run with: python -m pytest tests/test_system_utils.py -v
+Or standalone: python tests/test_system_utils.py
+"""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gvm.utils.system import listening_ports
+
+# Trimmed "ss -ltn" output with IPv4, IPv6 and wildcard listeners
+_SS_OUTPUT = """\
+State  Recv-Q Send-Q Local Address:Port  Peer Address:Port Process
+LISTEN 0      128          0.0.0.0:2222       0.0.0.0:*
+LISTEN 0      128             [::]:8022          [::]:*
+LISTEN 0      4096       127.0.0.1:122        0.0.0.0:*
+LISTEN 0      128                *:5900             *:*
+"""
+
+
+class TestListeningPorts(unittest.TestCase):
+    """Test cases for listening_ports()."""
+
+    @patch("gvm.utils.system.subprocess.run")
+    def test_returns_requested_listening_ports(self, mock_run: MagicMock) -> None:
+        """Only requested ports with a listener are returned."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=_SS_OUTPUT)
+
+        ports = listening_ports([2222, 8022, 5900, 3000])
+
+        self.assertEqual(ports, {2222, 8022, 5900})
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args[0][0], ["ss", "-ltn"])
+
+    @patch("gvm.utils.system.subprocess.run")
+    def test_port_suffix_does_not_match(self, mock_run: MagicMock) -> None:
+        """Port 22 is not reported because of a listener on 122 or 2222."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=_SS_OUTPUT)
+
+        self.assertEqual(listening_ports([22]), set())
+
+    @patch("gvm.utils.system.subprocess.run")
+    def test_port_prefix_does_not_match(self, mock_run: MagicMock) -> None:
+        """Port 80 is not reported because of a listener on 8022."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=_SS_OUTPUT)
+
+        self.assertEqual(listening_ports([80, 802]), set())
+
+    @patch("gvm.utils.system.subprocess.run")
+    def test_empty_request_skips_ss(self, mock_run: MagicMock) -> None:
+        """No ports requested means no ss call."""
+        self.assertEqual(listening_ports([]), set())
+        mock_run.assert_not_called()
+
+    @patch("gvm.utils.system.subprocess.run")
+    def test_ss_failure_returns_empty(self, mock_run: MagicMock) -> None:
+        """A non-zero ss exit reports nothing as listening."""
+        mock_run.return_value = MagicMock(returncode=1, stdout=_SS_OUTPUT)
+
+        self.assertEqual(listening_ports([2222]), set())
+
+    @patch("gvm.utils.system.subprocess.run", side_effect=FileNotFoundError)
+    def test_missing_ss_returns_empty(self, _mock_run: MagicMock) -> None:
+        """A missing ss binary reports nothing as listening."""
+        self.assertEqual(listening_ports([2222]), set())
+
+
+if __name__ == "__main__":
+    unittest.main()